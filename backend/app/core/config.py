@@ -1,80 +1,120 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Environment variables are only read here, once per Settings() build; the rest
+# of the app reads `settings.<field>` instead of calling os.getenv.
+_TRUTHY = frozenset({"1", "true", "yes", "y", "on"})
 
-def _get_bool(name: str, default: bool) -> bool:
+
+def _raw(name: str) -> str | None:
     raw = os.getenv(name)
     if raw is None or raw == "":
-        return default
-    return raw.strip().lower() in {"1", "true", "yes", "y", "on"}
+        return None
+    return raw
 
 
-def _get_int(name: str, default: int) -> int:
-    raw = os.getenv(name)
-    if raw is None or raw == "":
-        return default
-    return int(raw)
+def _env(name: str, default: str | None = None) -> Any:
+    return field(default_factory=lambda: os.getenv(name, default))
 
 
-def _get_float(name: str, default: float) -> float:
-    raw = os.getenv(name)
-    if raw is None or raw == "":
-        return default
-    return float(raw)
+def _get_bool(name: str, default: bool) -> Any:
+    def _read() -> bool:
+        raw = _raw(name)
+        return default if raw is None else raw.strip().lower() in _TRUTHY
 
+    return field(default_factory=_read)
 
-def _get_optional_int(name: str) -> int | None:
-    raw = os.getenv(name)
-    if raw is None or raw == "":
-        return None
-    return int(raw)
 
+def _get_int(name: str, default: int) -> Any:
+    def _read() -> int:
+        raw = _raw(name)
+        return default if raw is None else int(raw)
 
-def _get_optional_bool(name: str) -> bool | None:
-    raw = os.getenv(name)
-    if raw is None or raw == "":
-        return None
-    return raw.strip().lower() in {"1", "true", "yes", "y", "on"}
+    return field(default_factory=_read)
+
+
+def _get_float(name: str, default: float) -> Any:
+    def _read() -> float:
+        raw = _raw(name)
+        return default if raw is None else float(raw)
+
+    return field(default_factory=_read)
+
+
+def _get_optional_int(name: str) -> Any:
+    def _read() -> int | None:
+        raw = _raw(name)
+        return None if raw is None else int(raw)
+
+    return field(default_factory=_read)
+
+
+def _get_optional_bool(name: str) -> Any:
+    def _read() -> bool | None:
+        raw = _raw(name)
+        return None if raw is None else raw.strip().lower() in _TRUTHY
+
+    return field(default_factory=_read)
 
 
 @dataclass(frozen=True)
 class Settings:
-    environment: str = os.getenv("ENVIRONMENT", "dev")
-    log_level: str = os.getenv("LOG_LEVEL", "INFO")
+    environment: str = _env("ENVIRONMENT", "dev")
+    log_level: str = _env("LOG_LEVEL", "INFO")
+    # Emit one JSON object per log line instead of plain text.
+    log_json: bool = _get_bool("LOG_JSON", False)
 
-    database_url: str = os.getenv("DATABASE_URL", "sqlite:///./data.sqlite3")
+    database_url: str = _env("DATABASE_URL", "sqlite:///./data.sqlite3")
+    # Finished jobs stay queryable this long before they are dropped (0 keeps them forever).
+    job_ttl_s: float = _get_float("JOB_TTL_S", 3600.0)
 
-    openai_api_key: str | None = os.getenv("OPENAI_API_KEY")
-    openai_model: str = os.getenv("OPENAI_MODEL", "gpt-5-nano")
+    openai_api_key: str | None = _env("OPENAI_API_KEY")
+    openai_model: str = _env("OPENAI_MODEL", "gpt-5-nano")
 
     # Reddit (can be configured later)
-    reddit_client_id: str | None = os.getenv("REDDIT_CLIENT_ID")
-    reddit_client_secret: str | None = os.getenv("REDDIT_CLIENT_SECRET")
-    reddit_username: str | None = os.getenv("REDDIT_USERNAME")
-    reddit_password: str | None = os.getenv("REDDIT_PASSWORD")
-    reddit_user_agent: str = os.getenv("REDDIT_USER_AGENT", "SocialIntelEngine/0.1")
+    reddit_client_id: str | None = _env("REDDIT_CLIENT_ID")
+    reddit_client_secret: str | None = _env("REDDIT_CLIENT_SECRET")
+    reddit_username: str | None = _env("REDDIT_USERNAME")
+    reddit_password: str | None = _env("REDDIT_PASSWORD")
+    reddit_user_agent: str = _env("REDDIT_USER_AGENT", "SocialIntelEngine/0.1")
     reddit_min_interval_s: float = _get_float("REDDIT_MIN_INTERVAL_S", 1.0)
+    # Request starts allowed per rolling minute by the httpx client (0 = no cap).
+    reddit_max_rpm: int = _get_int("REDDIT_MAX_RPM", 60)
+    # Where the OAuth token is kept between restarts (empty = memory only).
+    reddit_token_cache_path: str = _env(
+        "REDDIT_TOKEN_CACHE_PATH", "~/.cache/sie/reddit_token.json"
+    )
+    # Reddit requests in flight at once; starts are still spaced by REDDIT_MIN_INTERVAL_S.
+    reddit_concurrency: int = _get_int("REDDIT_CONCURRENCY", 4)
+    # How long cached subreddit /about data is reused across runs (0 disables the cache).
+    subreddit_about_ttl_s: float = _get_float("SUBREDDIT_ABOUT_TTL_S", 21600.0)
 
     # Proxy settings
     proxy_enabled: bool = _get_bool("PROXY_ENABLED", False)
-    proxy_list_url: str | None = os.getenv("PROXY_LIST_URL")
+    proxy_list_url: str | None = _env("PROXY_LIST_URL")
     proxy_refresh_interval_s: float = _get_float("PROXY_REFRESH_INTERVAL_S", 300.0)
-    proxy_default_scheme: str = os.getenv("PROXY_DEFAULT_SCHEME", "socks5")
+    proxy_default_scheme: str = _env("PROXY_DEFAULT_SCHEME", "socks5")
     proxy_pool_size: int = _get_int("PROXY_POOL_SIZE", 20)
-    proxy_cache_path: str = os.getenv("PROXY_CACHE_PATH", "proxy_cache.json")
+    proxy_cache_path: str = _env("PROXY_CACHE_PATH", "proxy_cache.json")
     proxy_cache_enabled: bool = _get_bool("PROXY_CACHE_ENABLED", True)
+    # Probe refreshed proxies (one GET to PROXY_VALIDATE_URL each) before using them.
+    proxy_validate_enabled: bool = _get_bool("PROXY_VALIDATE_ENABLED", True)
+    proxy_validate_url: str = _env("PROXY_VALIDATE_URL", "https://www.reddit.com/robots.txt")
+    proxy_validate_timeout_s: float = _get_float("PROXY_VALIDATE_TIMEOUT_S", 3.0)
 
     # Proxifly (optional proxy source; server-side only)
-    proxifly_api_key: str | None = os.getenv("PROXIFLY_API_KEY")
-    proxifly_protocol: str = os.getenv("PROXIFLY_PROTOCOL", "socks5")
-    proxifly_anonymity: str | None = os.getenv("PROXIFLY_ANONYMITY")
-    proxifly_country: str | None = os.getenv("PROXIFLY_COUNTRY")
+    proxifly_api_key: str | None = _env("PROXIFLY_API_KEY")
+    proxifly_protocol: str = _env("PROXIFLY_PROTOCOL", "socks5")
+    proxifly_anonymity: str | None = _env("PROXIFLY_ANONYMITY")
+    proxifly_country: str | None = _env("PROXIFLY_COUNTRY")
     proxifly_https: bool | None = _get_optional_bool("PROXIFLY_HTTPS")
     proxifly_speed_ms: int | None = _get_optional_int("PROXIFLY_SPEED_MS")
     proxifly_max_retries: int = _get_int("PROXIFLY_MAX_RETRIES", 3)
@@ -96,7 +136,29 @@ class Settings:
     max_discovered_subreddits: int = _get_int("MAX_DISCOVERED_SUBREDDITS", 50)
     max_llm_sources: int = _get_int("MAX_LLM_SOURCES", 40)
     llm_batch_size: int = _get_int("LLM_BATCH_SIZE", 5)
+    # Upper bound for adaptive batching; set equal to LLM_BATCH_SIZE to pin the size.
+    llm_max_batch_size: int = _get_int("LLM_MAX_BATCH_SIZE", 20)
+    # Estimated source tokens per extraction request; bigger batches are split (0 = no cap).
+    llm_max_batch_tokens: int = _get_int("LLM_MAX_BATCH_TOKENS", 12000)
+    # Extraction requests in flight at once, and an optional requests/minute cap (0 = none).
+    llm_concurrency: int = _get_int("LLM_CONCURRENCY", 4)
+    llm_max_rpm: int = _get_int("LLM_MAX_RPM", 0)
+    # Estimated prompt tokens allowed in flight across those requests (0 = no cap).
+    llm_max_inflight_tokens: int = _get_int("LLM_MAX_INFLIGHT_TOKENS", 0)
     max_source_chars: int = _get_int("MAX_SOURCE_CHARS", 2000)
+    # Exact-match cache of LLM responses: entries kept in memory, and an optional
+    # SQLite file that keeps them across restarts (empty path = memory only; the
+    # file holds prompts with scraped text, so it is opt-in).
+    llm_cache_size: int = _get_int("LLM_CACHE_SIZE", 1024)
+    llm_cache_path: str = _env("LLM_CACHE_PATH", "")
+    # Cached responses older than this are ignored and pruned (0 keeps them forever).
+    llm_cache_ttl_s: float = _get_float("LLM_CACHE_TTL_S", 7 * 24 * 3600.0)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build Settings once; tests can call get_settings.cache_clear() to re-read env."""
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
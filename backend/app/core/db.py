@@ -1,7 +1,11 @@
 from __future__ import annotations
 
-from sqlalchemy import create_engine
+import hashlib
+
+from sqlalchemy import Text, cast, create_engine, event, inspect, make_url, select, text
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateIndex, CreateTable
 
 from .config import settings
 
@@ -10,21 +14,139 @@ class Base(DeclarativeBase):
     pass
 
 
-_engine = create_engine(
-    settings.database_url,
-    connect_args={"check_same_thread": False}
-    if settings.database_url.startswith("sqlite")
-    else {},
-)
+_is_sqlite = settings.database_url.startswith("sqlite")
+
+
+def _engine_options() -> dict:
+    # Only SQLite is supported: the repositories build their upserts with the
+    # SQLite insert construct.
+    options: dict = {"connect_args": {"check_same_thread": False}}
+    if make_url(settings.database_url).database in (None, "", ":memory:"):
+        # Every connection to :memory: is a separate database; share one.
+        options["poolclass"] = StaticPool
+    # File databases keep SQLAlchemy's default QueuePool, which reuses open
+    # connections across sessions without sharing one between threads.
+    return options
+
+
+_engine = create_engine(settings.database_url, **_engine_options())
+
+if _is_sqlite:
+
+    @event.listens_for(_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+        # WAL lets API reads proceed while an analysis job writes, and with
+        # synchronous=NORMAL commits no longer fsync the main database file.
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-65536")  # 64 MiB
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+        # Some builds default secure_delete on, which zero-fills every freed page
+        # and makes clearing tables between runs proportional to their size.
+        cursor.execute("PRAGMA secure_delete=OFF")
+        cursor.close()
 
 SessionLocal = sessionmaker(bind=_engine, autoflush=False, autocommit=False)
 
 
+def _schema_fingerprint() -> int:
+    # Stable across processes (unlike hash()) and sized to fit SQLite's
+    # signed 32-bit user_version; never 0, which is what a fresh file reports.
+    dialect = _engine.dialect
+    ddl = []
+    for table in Base.metadata.sorted_tables:
+        ddl.append(str(CreateTable(table).compile(dialect=dialect)))
+        for index in sorted(table.indexes, key=lambda idx: idx.name or ""):
+            ddl.append(str(CreateIndex(index).compile(dialect=dialect)))
+    digest = hashlib.sha256("\n".join(ddl).encode()).digest()
+    return (int.from_bytes(digest[:4], "big") & 0x7FFFFFFF) or 1
+
+
 def init_db() -> None:
     # Ensure models are registered before create_all.
     from .. import models  # noqa: F401
 
+    fingerprint = None
+    if _is_sqlite:
+        # The fingerprint of the models the file was last brought up to date with
+        # is kept in the database itself, so a deleted or swapped file can't
+        # leave a stale marker behind. A match skips the per-table probes below.
+        fingerprint = _schema_fingerprint()
+        with _engine.connect() as conn:
+            if conn.execute(text("PRAGMA user_version")).scalar() == fingerprint:
+                return
+
+    _upgrade_existing_tables()
     Base.metadata.create_all(bind=_engine)
+    # create_all skips tables that already exist, so indexes added to the models
+    # later are never built on an existing database; create any that are missing.
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=_engine, checkfirst=True)
+
+    if fingerprint is not None:
+        with _engine.begin() as conn:
+            conn.execute(text(f"PRAGMA user_version = {fingerprint}"))
+
+
+def _upgrade_existing_tables() -> None:
+    """
+    Bring tables created by an older version of the models up to what the code needs.
+
+    create_all never touches existing tables, so anything it can't reconcile is
+    handled here before the new schema fingerprint is stamped: a missing column
+    or a column the models fill in through a server default (created_at) that
+    the existing table lacks one for stops startup with an error, and list
+    columns still holding JSON arrays are rewritten in the delimited format.
+    """
+    from ..models import DelimitedList
+
+    with _engine.begin() as conn:
+        existing = set(inspect(conn).get_table_names())
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing:
+                continue
+            present = {
+                column["name"]: column["default"]
+                for column in inspect(conn).get_columns(table.name)
+            }
+            missing = [column.name for column in table.columns if column.name not in present]
+            # Inserts leave these columns out, so without the default they'd be NULL.
+            no_default = [
+                column.name
+                for column in table.columns
+                if column.server_default is not None
+                and column.name in present
+                and present[column.name] is None
+            ]
+            if missing or no_default:
+                problems = []
+                if missing:
+                    problems.append(f"is missing columns {missing}")
+                if no_default:
+                    problems.append(f"has no server default on {no_default}")
+                raise RuntimeError(
+                    f"Database table {table.name!r} {' and '.join(problems)}; "
+                    "it was created by an incompatible version. Migrate or delete "
+                    f"the database at {settings.database_url} and restart."
+                )
+            list_columns = [
+                column for column in table.columns if isinstance(column.type, DelimitedList)
+            ]
+            if not list_columns:
+                continue
+            (pk,) = table.primary_key.columns
+            for column in list_columns:
+                # Reading through the column type decodes legacy JSON; writing
+                # back stores the same list delimited.
+                # The cast keeps the LIKE pattern from being bound as a list.
+                rows = conn.execute(
+                    select(pk, column).where(cast(column, Text).like("[%"))
+                ).all()
+                for key, values in rows:
+                    conn.execute(table.update().where(pk == key).values({column.name: values}))
 
 
 def get_db():
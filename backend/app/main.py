@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+
 from fastapi import Depends, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import func, select
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+from sqlalchemy import func, lambda_stmt, select
 from sqlalchemy.orm import Session
 from sqlalchemy.orm import aliased
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from .core.config import settings
 from .core.db import SessionLocal, get_db, init_db
@@ -18,39 +24,30 @@ from .schemas import (
     RelationshipOut,
     SubredditOut,
  )
-from .services.analyze import run_analysis
-from .services.competitive import build_competitive_overview
 from .services.jobs import job_manager
-from .services.llm import LLMConfigError
-from .services.proxy import ProxyManager
-from .services.reddit import RedditAuthError, RedditConfigError, RedditRequestError
 from .utils.logging import get_logger, setup_logging
 
+# Service modules pull in Playwright, the OpenAI SDK and the proxy/HTTP stack;
+# they are imported where used so startup and light endpoints don't pay for them.
+if TYPE_CHECKING:
+    from .services.proxy import ProxyManager
+
 logger = get_logger("sie.api")
 
 # Global proxy manager (initialized on startup if enabled)
 proxy_manager: ProxyManager | None = None
 
-app = FastAPI(title="Social Intelligence Engine API")
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-
-@app.on_event("startup")
 def _startup() -> None:
     global proxy_manager
-    setup_logging(settings.log_level)
+    setup_logging(settings.log_level, json_format=settings.log_json)
     logger.info("Starting API")
     init_db()
 
     # Initialize proxy manager if enabled
     if settings.proxy_enabled and (settings.proxy_list_url or settings.proxifly_api_key):
+        from .services.proxy import ProxyManager
+
         proxy_manager = ProxyManager(
             proxy_url=settings.proxy_list_url,
             refresh_interval_s=settings.proxy_refresh_interval_s,
@@ -69,14 +66,20 @@ def _startup() -> None:
             proxifly_max_backoff_s=settings.proxifly_max_backoff_s,
             proxifly_rate_limit_cooldown_s=settings.proxifly_rate_limit_cooldown_s,
             proxifly_max_wait_s=settings.proxifly_max_wait_s,
+            # Fetch on the refresh thread so a slow or rate-limited provider
+            # doesn't hold up startup; the cached pool is usable meanwhile.
+            initial_fetch=False,
+            validate_proxies=settings.proxy_validate_enabled,
+            validate_url=settings.proxy_validate_url,
+            validate_timeout_s=settings.proxy_validate_timeout_s,
         )
         proxy_manager.start_refresh_loop()
         logger.info(
-            "Proxy rotation enabled with %d proxies", proxy_manager.proxy_count
+            "Proxy rotation enabled with %d cached proxies; refreshing in background",
+            proxy_manager.proxy_count,
         )
 
 
-@app.on_event("shutdown")
 def _shutdown() -> None:
     global proxy_manager
     if proxy_manager is not None:
@@ -85,8 +88,80 @@ def _shutdown() -> None:
         logger.info("Proxy manager stopped")
 
 
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    _startup()
+    try:
+        yield
+    finally:
+        _shutdown()
+
+
+app = FastAPI(
+    title="Social Intelligence Engine API",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    # The API uses no cookies or auth headers; credentialed CORS only added per-request work.
+    allow_credentials=False,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+
+class _HealthProbeMiddleware:
+    """
+    Answers GET /health before CORS and the rest of the stack run. Probes hit it
+    at high frequency, are never cross-origin, and the payload is fixed for the
+    life of the process, so the response body is rendered once up front.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self._app = app
+        self._response = ORJSONResponse(_health_payload())
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] == "/health" and scope["method"] in ("GET", "HEAD"):
+            await self._response(scope, receive, send)
+            return
+        await self._app(scope, receive, send)
+
+
+def _health_payload() -> dict:
+    return {"status": "ok", "environment": settings.environment}
+
+
+# Added last so it sits outside CORSMiddleware.
+app.add_middleware(_HealthProbeMiddleware)
+
+
+# Module-level so the lambda_stmt in list_relationships closes over globals rather
+# than fresh per-request aliases, which would defeat its statement cache.
+_subject_entity = aliased(Entity)
+_object_entity = aliased(Entity)
+
+
+def _respond(content: BaseModel | list[BaseModel]) -> ORJSONResponse:
+    # Returning a Response skips FastAPI's validate-then-serialize pass over
+    # models we just built; response_model on the route still documents the shape.
+    if isinstance(content, list):
+        return ORJSONResponse([item.model_dump() for item in content])
+    return ORJSONResponse(content.model_dump())
+
+
 def _run_job(job_id: str, domain: str, competitors: list[str]) -> None:
+    from .services.analyze import run_analysis
+    from .services.llm import LLMConfigError
+    from .services.reddit import RedditAuthError, RedditConfigError, RedditRequestError
+
     job_manager.start_job(job_id)
+    if proxy_manager is not None:
+        # Give the background initial fetch a chance to land before scraping.
+        proxy_manager.wait_ready(timeout=settings.proxifly_max_wait_s)
     db = SessionLocal()
     try:
         result = run_analysis(
@@ -110,7 +185,8 @@ def _run_job(job_id: str, domain: str, competitors: list[str]) -> None:
 
 @app.get("/health")
 def health() -> dict:
-    return {"status": "ok", "environment": settings.environment}
+    # Normally answered by _HealthProbeMiddleware; kept for the OpenAPI schema.
+    return _health_payload()
 
 
 @app.get("/api/proxies")
@@ -163,53 +239,92 @@ def job_status(job_id: str) -> dict:
     }
 
 
-@app.get("/api/subreddits")
-def list_subreddits(db: Session = Depends(get_db)) -> list[SubredditOut]:
-    rows = db.execute(select(Subreddit).order_by(Subreddit.score.desc())).scalars().all()
-    return [
+@app.get("/api/subreddits", response_model=list[SubredditOut])
+def list_subreddits(db: Session = Depends(get_db)) -> ORJSONResponse:
+    stmt = select(
+        Subreddit.name,
+        Subreddit.score,
+        Subreddit.mention_count,
+        Subreddit.avg_engagement,
+        Subreddit.subscribers,
+        Subreddit.active_user_count,
+        Subreddit.topic_relevance,
+        Subreddit.public_description,
+    ).order_by(Subreddit.score.desc())
+    rows = db.execute(stmt).all()
+    subreddits = [
         SubredditOut(
-            name=row.name,
-            score=row.score,
-            mention_count=row.mention_count,
-            avg_engagement=row.avg_engagement,
-            subscribers=row.subscribers,
-            active_user_count=row.active_user_count,
-            topic_relevance=row.topic_relevance,
-            public_description=row.public_description,
+            name=name,
+            score=score,
+            mention_count=mention_count,
+            avg_engagement=avg_engagement,
+            subscribers=subscribers,
+            active_user_count=active_user_count,
+            topic_relevance=topic_relevance,
+            public_description=public_description,
         )
-        for row in rows
+        for (
+            name,
+            score,
+            mention_count,
+            avg_engagement,
+            subscribers,
+            active_user_count,
+            topic_relevance,
+            public_description,
+        ) in rows
     ]
+    return _respond(subreddits)
 
 
-@app.get("/api/entities")
-def list_entities(db: Session = Depends(get_db)) -> list[EntityOut]:
-    stmt = (
-        select(Entity, func.count(Mention.id).label("mention_count"))
+@app.get("/api/entities", response_model=list[EntityOut])
+def list_entities(db: Session = Depends(get_db)) -> ORJSONResponse:
+    stmt = lambda_stmt(
+        lambda: select(
+            Entity.id,
+            Entity.canonical_name,
+            Entity.aliases,
+            Entity.entity_type,
+            func.count(Mention.id).label("mention_count"),
+        )
         .outerjoin(Mention, Mention.entity_id == Entity.id)
         .group_by(Entity.id)
         .order_by(func.count(Mention.id).desc(), Entity.canonical_name.asc())
     )
     rows = db.execute(stmt).all()
-    return [
+    entities = [
         EntityOut(
-            id=entity.id,
-            canonical_name=entity.canonical_name,
-            aliases=list(entity.aliases or []),
-            entity_type=entity.entity_type,
+            id=entity_id,
+            canonical_name=canonical_name,
+            aliases=list(aliases or []),
+            entity_type=entity_type,
             mention_count=int(mention_count or 0),
         )
-        for entity, mention_count in rows
+        for entity_id, canonical_name, aliases, entity_type, mention_count in rows
     ]
+    return _respond(entities)
 
 
-@app.get("/api/entities/{entity_id}")
-def get_entity(entity_id: int, db: Session = Depends(get_db)) -> EntityDetailOut:
-    entity = db.get(Entity, entity_id)
+@app.get("/api/entities/{entity_id}", response_model=EntityDetailOut)
+def get_entity(entity_id: int, db: Session = Depends(get_db)) -> ORJSONResponse:
+    entity = db.execute(
+        select(Entity.canonical_name, Entity.aliases, Entity.entity_type).where(
+            Entity.id == entity_id
+        )
+    ).first()
     if entity is None:
         raise HTTPException(status_code=404, detail="Entity not found")
 
     mentions_stmt = (
-        select(Mention, Source)
+        select(
+            Mention.id,
+            Mention.surface_form,
+            Mention.snippet,
+            Mention.confidence,
+            Source.id,
+            Source.url,
+            Source.subreddit,
+        )
         .join(Source, Source.id == Mention.source_id)
         .where(Mention.entity_id == entity_id)
         .order_by(Mention.id.desc())
@@ -217,15 +332,23 @@ def get_entity(entity_id: int, db: Session = Depends(get_db)) -> EntityDetailOut
     mention_rows = db.execute(mentions_stmt).all()
     mentions = [
         MentionOut(
-            id=mention.id,
-            surface_form=mention.surface_form,
-            snippet=mention.snippet,
-            source_id=source.id,
-            source_url=source.url,
-            subreddit=source.subreddit,
-            confidence=float(mention.confidence),
+            id=mention_id,
+            surface_form=surface_form,
+            snippet=snippet,
+            source_id=source_id,
+            source_url=source_url,
+            subreddit=subreddit,
+            confidence=float(confidence),
         )
-        for mention, source in mention_rows
+        for (
+            mention_id,
+            surface_form,
+            snippet,
+            confidence,
+            source_id,
+            source_url,
+            subreddit,
+        ) in mention_rows
     ]
 
     rel_stmt = (
@@ -245,65 +368,100 @@ def get_entity(entity_id: int, db: Session = Depends(get_db)) -> EntityDetailOut
         for rel_type, target, count in rel_rows
     ]
 
-    return EntityDetailOut(
-        id=entity.id,
+    detail = EntityDetailOut(
+        id=entity_id,
         canonical_name=entity.canonical_name,
         aliases=list(entity.aliases or []),
         entity_type=entity.entity_type,
         mentions=mentions,
         relationships=relationships,
     )
+    return _respond(detail)
 
 
-@app.get("/api/relationships")
-def list_relationships(db: Session = Depends(get_db)) -> list[RelationshipOut]:
-    subject = aliased(Entity)
-    obj = aliased(Entity)
-    stmt = (
-        select(Relationship, subject.canonical_name, obj.canonical_name, Source.url)
-        .join(subject, subject.id == Relationship.subject_entity_id)
-        .join(obj, obj.id == Relationship.object_entity_id)
+@app.get("/api/relationships", response_model=list[RelationshipOut])
+def list_relationships(db: Session = Depends(get_db)) -> ORJSONResponse:
+    stmt = lambda_stmt(
+        lambda: select(
+            Relationship.id,
+            Relationship.relationship_type,
+            _subject_entity.canonical_name,
+            _object_entity.canonical_name,
+            Relationship.confidence,
+            Relationship.evidence,
+            Relationship.source_id,
+            Source.url,
+        )
+        .join(_subject_entity, _subject_entity.id == Relationship.subject_entity_id)
+        .join(_object_entity, _object_entity.id == Relationship.object_entity_id)
         .outerjoin(Source, Source.id == Relationship.source_id)
         .order_by(Relationship.id.desc())
     )
     rows = db.execute(stmt).all()
-    return [
+    relationships = [
         RelationshipOut(
-            id=rel.id,
-            type=rel.relationship_type,
+            id=rel_id,
+            type=rel_type,
             subject=subject_name,
             object=object_name,
-            confidence=float(rel.confidence),
-            evidence=rel.evidence,
-            source_id=rel.source_id,
+            confidence=float(confidence),
+            evidence=evidence,
+            source_id=source_id,
             source_url=source_url,
         )
-        for rel, subject_name, object_name, source_url in rows
+        for (
+            rel_id,
+            rel_type,
+            subject_name,
+            object_name,
+            confidence,
+            evidence,
+            source_id,
+            source_url,
+        ) in rows
     ]
+    return _respond(relationships)
 
 
 @app.get("/api/competitive")
 def competitive_overview(db: Session = Depends(get_db)) -> dict:
+    from .services.competitive import build_competitive_overview
+
     return build_competitive_overview(db)
 
 
 @app.get("/api/graph")
 def graph(db: Session = Depends(get_db)) -> dict:
-    entities = db.execute(select(Entity)).scalars().all()
-    relationships = db.execute(select(Relationship)).scalars().all()
-
+    # Stream plain column tuples in chunks rather than loading every row as an ORM object.
+    entity_rows = db.execute(
+        lambda_stmt(lambda: select(Entity.id, Entity.canonical_name, Entity.entity_type)),
+        execution_options={"yield_per": 1000},
+    )
     nodes = [
-        {"id": entity.id, "name": entity.canonical_name, "type": entity.entity_type}
-        for entity in entities
+        {"id": entity_id, "name": name, "type": entity_type}
+        for entity_id, name, entity_type in entity_rows
     ]
+
+    relationship_rows = db.execute(
+        lambda_stmt(
+            lambda: select(
+                Relationship.subject_entity_id,
+                Relationship.object_entity_id,
+                Relationship.relationship_type,
+                Relationship.confidence,
+                Relationship.source_id,
+            )
+        ),
+        execution_options={"yield_per": 1000},
+    )
     edges = [
         {
-            "source": rel.subject_entity_id,
-            "target": rel.object_entity_id,
-            "type": rel.relationship_type,
-            "confidence": rel.confidence,
-            "source_id": rel.source_id,
+            "source": subject_id,
+            "target": object_id,
+            "type": relationship_type,
+            "confidence": confidence,
+            "source_id": source_id,
         }
-        for rel in relationships
+        for subject_id, object_id, relationship_type, confidence, source_id in relationship_rows
     ]
     return {"nodes": nodes, "edges": edges}
@@ -2,12 +2,47 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, JSON, String, Text
+import orjson
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.types import TypeDecorator
 
 from ..core.db import Base
 
 
+class DelimitedList(TypeDecorator):
+    """
+    A list of strings stored as one delimited TEXT value.
+
+    Loading is a str.split instead of a json.loads per row. The delimiter is the
+    ASCII unit separator, which never shows up in names; it is stripped from
+    values on write just in case. Rows written before this type existed hold a
+    JSON array and are still read as one.
+    """
+
+    impl = Text
+    cache_ok = True
+
+    _SEP = "\x1f"
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return self._SEP.join(item.replace(self._SEP, "") for item in value)
+
+    def process_result_value(self, value, dialect):
+        if not value:
+            return []
+        if value[0] == "[":
+            try:
+                decoded = orjson.loads(value)
+            except orjson.JSONDecodeError:
+                decoded = None
+            if isinstance(decoded, list):
+                return [str(item) for item in decoded]
+        return value.split(self._SEP)
+
+
 class Subreddit(Base):
     __tablename__ = "subreddits"
 
@@ -24,7 +59,18 @@ class Subreddit(Base):
 
     public_description: Mapped[str | None] = mapped_column(Text, nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+
+
+class SubredditAbout(Base):
+    # Cache of /about fields; survives clear_all so later runs can skip the request.
+    __tablename__ = "subreddit_about_cache"
+
+    name: Mapped[str] = mapped_column(String(128), primary_key=True)
+    subscribers: Mapped[int] = mapped_column(Integer, default=0)
+    active_user_count: Mapped[int] = mapped_column(Integer, default=0)
+    public_description: Mapped[str] = mapped_column(Text, default="")
+    fetched_at: Mapped[float] = mapped_column(Float)
 
 
 class AnalysisContext(Base):
@@ -32,10 +78,10 @@ class AnalysisContext(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     company_name: Mapped[str] = mapped_column(String(256))
-    company_aliases: Mapped[list[str]] = mapped_column(JSON, default=list)
-    competitors: Mapped[list[str]] = mapped_column(JSON, default=list)
+    company_aliases: Mapped[list[str]] = mapped_column(DelimitedList, default=list)
+    competitors: Mapped[list[str]] = mapped_column(DelimitedList, default=list)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
 
 class Source(Base):
@@ -57,7 +103,7 @@ class Source(Base):
         String(32), ForeignKey("sources.id"), nullable=True
     )
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
     mentions: Mapped[list["Mention"]] = relationship(
         back_populates="source", cascade="all, delete-orphan"
@@ -73,9 +119,9 @@ class Entity(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     canonical_name: Mapped[str] = mapped_column(String(256), unique=True, index=True)
     entity_type: Mapped[str | None] = mapped_column(String(64), nullable=True)
-    aliases: Mapped[list[str]] = mapped_column(JSON, default=list)
+    aliases: Mapped[list[str]] = mapped_column(DelimitedList, default=list)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
     mentions: Mapped[list["Mention"]] = relationship(
         back_populates="entity", cascade="all, delete-orphan"
@@ -103,7 +149,7 @@ class Mention(Base):
     snippet: Mapped[str | None] = mapped_column(Text, nullable=True)
     confidence: Mapped[float] = mapped_column(Float, default=0.0)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
     entity: Mapped[Entity] = relationship(back_populates="mentions")
     source: Mapped[Source] = relationship(back_populates="mentions")
@@ -111,6 +157,15 @@ class Mention(Base):
 
 class Relationship(Base):
     __tablename__ = "relationships"
+    __table_args__ = (
+        # Covers the per-entity (type, target) GROUP BY in the entity detail view.
+        Index(
+            "ix_relationships_subject_type_object",
+            "subject_entity_id",
+            "relationship_type",
+            "object_entity_id",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     subject_entity_id: Mapped[int] = mapped_column(
@@ -125,7 +180,7 @@ class Relationship(Base):
     evidence: Mapped[str | None] = mapped_column(Text, nullable=True)
     confidence: Mapped[float] = mapped_column(Float, default=0.0)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
     subject_entity: Mapped[Entity] = relationship(
         foreign_keys=[subject_entity_id], back_populates="outgoing_relationships"
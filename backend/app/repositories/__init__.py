@@ -1,18 +1,27 @@
 from __future__ import annotations
 
-from sqlalchemy import delete, select
+from dataclasses import asdict, dataclass
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
-from ..models import AnalysisContext, Entity, Mention, Relationship, Source, Subreddit
+from ..models import (
+    AnalysisContext,
+    Entity,
+    Mention,
+    Relationship,
+    Source,
+    Subreddit,
+    SubredditAbout,
+)
 
 
 def clear_all(db: Session) -> None:
-    db.execute(delete(AnalysisContext))
-    db.execute(delete(Relationship))
-    db.execute(delete(Mention))
-    db.execute(delete(Entity))
-    db.execute(delete(Source))
-    db.execute(delete(Subreddit))
+    # Children before parents, all in one transaction. Unfiltered DELETEs hit
+    # SQLite's truncate fast path since foreign-key enforcement is off.
+    for model in (AnalysisContext, Relationship, Mention, Entity, Source, Subreddit):
+        db.execute(delete(model))
     db.commit()
 
 
@@ -23,123 +32,141 @@ def get_or_create_entity(
     entity_type: str | None = None,
     aliases: list[str] | None = None,
 ) -> Entity:
-    existing = db.execute(
-        select(Entity).where(Entity.canonical_name == canonical_name)
-    ).scalar_one_or_none()
-    if existing is not None:
-        if entity_type and not existing.entity_type:
-            existing.entity_type = entity_type
-        if aliases:
-            existing_aliases = set(existing.aliases or [])
-            merged = list(existing_aliases.union(set(aliases)))
-            merged.sort(key=str.lower)
-            existing.aliases = merged
-        db.add(existing)
-        db.commit()
-        db.refresh(existing)
-        return existing
-
-    entity = Entity(
+    stmt = sqlite_insert(Entity).values(
         canonical_name=canonical_name,
         entity_type=entity_type,
         aliases=sorted(set(aliases or []), key=str.lower),
     )
-    db.add(entity)
-    db.commit()
-    db.refresh(entity)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Entity.canonical_name],
+        set_={"entity_type": func.coalesce(Entity.entity_type, stmt.excluded.entity_type)},
+    ).returning(Entity)
+    entity = db.execute(stmt, execution_options={"populate_existing": True}).scalar_one()
+
+    # Alias union can't be expressed in the upsert; only write when it adds something.
+    if aliases:
+        existing_aliases = list(entity.aliases or [])
+        merged = list(set(existing_aliases).union(aliases))
+        merged.sort(key=str.lower)
+        if merged != existing_aliases:
+            entity.aliases = merged
+            db.flush()
     return entity
 
 
-def upsert_subreddit(db: Session, payload: dict) -> Subreddit:
-    name = payload["name"]
-    existing = db.execute(select(Subreddit).where(Subreddit.name == name)).scalar_one_or_none()
-    if existing is None:
-        existing = Subreddit(name=name)
-
-    existing.score = float(payload.get("score", existing.score or 0.0))
-    existing.mention_count = int(payload.get("mention_count", existing.mention_count or 0))
-    existing.avg_engagement = float(payload.get("avg_engagement", existing.avg_engagement or 0.0))
-    existing.subscribers = int(payload.get("subscribers", existing.subscribers or 0))
-    existing.active_user_count = int(
-        payload.get("active_user_count", existing.active_user_count or 0)
+@dataclass(slots=True)
+class SubredditPayload:
+    name: str
+    score: float = 0.0
+    mention_count: int = 0
+    avg_engagement: float = 0.0
+    subscribers: int = 0
+    active_user_count: int = 0
+    topic_relevance: int = 0
+    public_description: str | None = None
+
+
+def upsert_subreddits(db: Session, payloads: list[SubredditPayload]) -> None:
+    # One executemany upsert keyed on the unique name instead of a SELECT,
+    # commit and refresh per subreddit.
+    if not payloads:
+        return
+    stmt = sqlite_insert(Subreddit)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Subreddit.name],
+        set_={
+            field: getattr(stmt.excluded, field)
+            for field in SubredditPayload.__dataclass_fields__
+            if field != "name"
+        },
     )
-    existing.topic_relevance = int(payload.get("topic_relevance", existing.topic_relevance or 0))
-    existing.public_description = payload.get("public_description", existing.public_description)
-
-    db.add(existing)
+    db.execute(stmt, [asdict(payload) for payload in payloads])
     db.commit()
-    db.refresh(existing)
-    return existing
 
 
-def add_source(db: Session, payload: dict) -> Source:
-    source_id = payload["id"]
-    existing = db.get(Source, source_id)
-    if existing is not None:
-        return existing
-
-    source = Source(
-        id=source_id,
-        kind=payload["kind"],
-        subreddit=payload["subreddit"],
-        author=payload.get("author"),
-        text=payload["text"],
-        url=payload.get("url"),
-        permalink=payload.get("permalink"),
-        created_utc=payload.get("created_utc"),
-        score=payload.get("score"),
-        parent_source_id=payload.get("parent_source_id"),
+def get_subreddit_abouts(
+    db: Session, names: list[str], *, fetched_after: float
+) -> dict[str, dict]:
+    if not names:
+        return {}
+    rows = db.execute(
+        select(
+            SubredditAbout.name,
+            SubredditAbout.subscribers,
+            SubredditAbout.active_user_count,
+            SubredditAbout.public_description,
+        ).where(SubredditAbout.name.in_(names), SubredditAbout.fetched_at > fetched_after)
+    ).all()
+    return {
+        name: {
+            "subscribers": subscribers,
+            "active_user_count": active_user_count,
+            "public_description": public_description,
+        }
+        for name, subscribers, active_user_count, public_description in rows
+    }
+
+
+def store_subreddit_abouts(db: Session, abouts: dict[str, dict], *, fetched_at: float) -> None:
+    if not abouts:
+        return
+    stmt = sqlite_insert(SubredditAbout)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[SubredditAbout.name],
+        set_={
+            "subscribers": stmt.excluded.subscribers,
+            "active_user_count": stmt.excluded.active_user_count,
+            "public_description": stmt.excluded.public_description,
+            "fetched_at": stmt.excluded.fetched_at,
+        },
+    )
+    db.execute(
+        stmt,
+        [{"name": name, "fetched_at": fetched_at, **fields} for name, fields in abouts.items()],
     )
-    db.add(source)
     db.commit()
-    db.refresh(source)
-    return source
 
 
-def add_mention(
-    db: Session,
-    *,
-    entity_id: int,
-    source_id: str,
-    surface_form: str,
-    snippet: str | None,
-    confidence: float,
-) -> Mention:
-    mention = Mention(
-        entity_id=entity_id,
-        source_id=source_id,
-        surface_form=surface_form,
-        snippet=snippet,
-        confidence=confidence,
-    )
-    db.add(mention)
+def _source_row(payload: dict) -> dict:
+    return {
+        "id": payload["id"],
+        "kind": payload["kind"],
+        "subreddit": payload["subreddit"],
+        "author": payload.get("author"),
+        "text": payload["text"],
+        "url": payload.get("url"),
+        "permalink": payload.get("permalink"),
+        "created_utc": payload.get("created_utc"),
+        "score": payload.get("score"),
+        "parent_source_id": payload.get("parent_source_id"),
+    }
+
+
+# INSERT OR IGNORE: the primary-key conflict check replaces a SELECT per source.
+_insert_source_or_ignore = sqlite_insert(Source).on_conflict_do_nothing(index_elements=[Source.id])
+
+
+def add_sources_bulk(db: Session, payloads: list[dict]) -> None:
+    if not payloads:
+        return
+    db.execute(_insert_source_or_ignore, [_source_row(payload) for payload in payloads])
     db.commit()
-    db.refresh(mention)
-    return mention
 
 
-def add_relationship(
+def persist_extractions(
     db: Session,
     *,
-    subject_entity_id: int,
-    object_entity_id: int,
-    relationship_type: str,
-    source_id: str | None,
-    evidence: str | None,
-    confidence: float,
-) -> Relationship:
-    relationship = Relationship(
-        subject_entity_id=subject_entity_id,
-        object_entity_id=object_entity_id,
-        relationship_type=relationship_type,
-        source_id=source_id,
-        evidence=evidence,
-        confidence=confidence,
-    )
-    db.add(relationship)
+    mentions: list[dict],
+    relationships: list[dict],
+) -> None:
+    # Both executemany INSERTs share one transaction and a single commit.
+    if not mentions and not relationships:
+        return
+    if mentions:
+        db.execute(insert(Mention), mentions)
+    if relationships:
+        db.execute(insert(Relationship), relationships)
     db.commit()
-    db.refresh(relationship)
-    return relationship
 
 
 def set_analysis_context(
@@ -2,7 +2,12 @@ from __future__ import annotations
 
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class _OutModel(BaseModel):
+    # Response models are built by the API from trusted DB rows.
+    model_config = ConfigDict(from_attributes=True, validate_assignment=False, extra="ignore")
 
 
 class AnalyzeRequest(BaseModel):
@@ -10,7 +15,7 @@ class AnalyzeRequest(BaseModel):
     competitors: list[str] = Field(default_factory=list)
 
 
-class SubredditOut(BaseModel):
+class SubredditOut(_OutModel):
     name: str
     score: float
     mention_count: int
@@ -21,7 +26,7 @@ class SubredditOut(BaseModel):
     public_description: str | None
 
 
-class EntityOut(BaseModel):
+class EntityOut(_OutModel):
     id: int
     canonical_name: str
     aliases: list[str]
@@ -29,7 +34,7 @@ class EntityOut(BaseModel):
     mention_count: int
 
 
-class MentionOut(BaseModel):
+class MentionOut(_OutModel):
     id: int
     surface_form: str
     snippet: str | None
@@ -56,7 +61,7 @@ class RelationshipType(str, Enum):
     critic = "critic"
 
 
-class RelationshipOut(BaseModel):
+class RelationshipOut(_OutModel):
     id: int
     type: RelationshipType
     subject: str
@@ -67,13 +72,13 @@ class RelationshipOut(BaseModel):
     source_url: str | None = None
 
 
-class EntityRelationshipSummary(BaseModel):
+class EntityRelationshipSummary(_OutModel):
     type: RelationshipType
     target: str
     count: int
 
 
-class EntityDetailOut(BaseModel):
+class EntityDetailOut(_OutModel):
     id: int
     canonical_name: str
     aliases: list[str]
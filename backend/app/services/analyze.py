@@ -1,30 +1,43 @@
 from __future__ import annotations
 
+import math
 import re
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from difflib import SequenceMatcher
-from typing import Any
+from functools import lru_cache
+from typing import Any, Iterable, Iterator
 from urllib.parse import urlparse
 
+from rapidfuzz import fuzz, process
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional multi-pattern matcher
+    ahocorasick = None
+
 from ..core.config import settings
 from ..models import Entity
 from ..repositories import (
-    add_mention,
-    add_relationship,
-    add_source,
+    SubredditPayload,
+    add_sources_bulk,
     clear_all,
     get_or_create_entity,
+    get_subreddit_abouts,
+    persist_extractions,
     set_analysis_context,
-    upsert_subreddit,
+    store_subreddit_abouts,
+    upsert_subreddits,
 )
-from .llm import LLMClient
+from .llm import BatchExtractionResult, LLMClient, LLMResponseCache, estimate_tokens
 from .proxy import ProxyManager
-from .reddit import RedditClient
+from .reddit import Backpressure, RedditClient
 from .reddit_browser import HybridRedditClient
-from .scoring import score_subreddits
+from .scoring import SubredditMetrics, score_subreddits
 
 
 ALLOWED_RELATIONSHIPS = [
@@ -65,8 +78,19 @@ _ENTITY_STOPWORDS = {
 }
 
 _ENTITY_NORMALIZE_RE = re.compile(r"[^a-z0-9]+")
+# ASCII fast path for the same mapping: every character except [a-z0-9] becomes a space.
+_ENTITY_NORMALIZE_TABLE = str.maketrans(
+    {char: " " for char in map(chr, range(128)) if not ("a" <= char <= "z" or "0" <= char <= "9")}
+)
+
+# Mentions/relationships are buffered and written in executemany chunks of this size.
+_WRITE_CHUNK_SIZE = 500
+
+# Upper bound on EntityResolver's per-run memo of name -> match results.
+_MATCH_CACHE_SIZE = 4096
 
 
+@lru_cache(maxsize=8192)
 def _normalize_entity_name(value: str) -> str:
     cleaned = value.strip().lower()
     if not cleaned:
@@ -74,11 +98,18 @@ def _normalize_entity_name(value: str) -> str:
     if cleaned.startswith("@"):
         cleaned = cleaned[1:]
     cleaned = cleaned.replace("&", "and")
-    cleaned = _ENTITY_NORMALIZE_RE.sub(" ", cleaned)
+    if cleaned.isascii():
+        cleaned = cleaned.translate(_ENTITY_NORMALIZE_TABLE)
+    else:
+        cleaned = _ENTITY_NORMALIZE_RE.sub(" ", cleaned)
     tokens = [token for token in cleaned.split() if token and token not in _ENTITY_STOPWORDS]
     return "".join(tokens)
 
 
+# Lowest similarity _ratio_to_confidence maps to a confidence.
+_FUZZY_CUTOFF = 0.82
+
+
 def _ratio_to_confidence(ratio: float) -> float | None:
     if ratio >= 0.96:
         return 0.9
@@ -86,7 +117,7 @@ def _ratio_to_confidence(ratio: float) -> float | None:
         return 0.85
     if ratio >= 0.88:
         return 0.8
-    if ratio >= 0.82:
+    if ratio >= _FUZZY_CUTOFF:
         return 0.7
     return None
 
@@ -96,52 +127,133 @@ def _merge_aliases(name: str, aliases: list[str] | None) -> list[str]:
     return [alias.strip() for alias in merged if alias and alias.strip()]
 
 
+class EntityCache:
+    """
+    Per-run map of canonical_name -> entity id.
+
+    Also remembers which aliases/entity_type are already persisted so repeat
+    resolutions can skip the upsert entirely.
+    """
+
+    def __init__(self) -> None:
+        self._ids: dict[str, int] = {}
+        self._aliases: dict[str, set[str]] = {}
+        self._typed: set[str] = set()
+
+    def get(
+        self,
+        canonical_name: str,
+        *,
+        entity_type: str | None = None,
+        aliases: list[str] | None = None,
+    ) -> int | None:
+        entity_id = self._ids.get(canonical_name)
+        if entity_id is None:
+            return None
+        if entity_type and canonical_name not in self._typed:
+            return None
+        if aliases and not self._aliases[canonical_name].issuperset(aliases):
+            return None
+        return entity_id
+
+    def store(self, entity: Entity) -> None:
+        self._ids[entity.canonical_name] = entity.id
+        self._aliases[entity.canonical_name] = set(entity.aliases or [])
+        if entity.entity_type:
+            self._typed.add(entity.canonical_name)
+
+    def clear(self) -> None:
+        self._ids.clear()
+        self._aliases.clear()
+        self._typed.clear()
+
+
 class EntityResolver:
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: Session, cache: EntityCache | None = None) -> None:
         self._db = db
+        self._cache = cache if cache is not None else EntityCache()
         self._index: dict[str, int] = {}
+        # Canonical names of registered entities by id. Plain strings rather than ORM
+        # instances, which expire on every commit and would reload on access.
+        self._names_by_id: dict[int, str] = {}
+        # Raw names already folded into the index; re-registering an entity only
+        # normalizes aliases it has gained since.
+        self._registered: set[str] = set()
+        # Fuzzy-match candidates (index keys long enough to score meaningfully),
+        # bucketed by length so hopeless lengths are never handed to the scorer.
+        self._keys_by_len: dict[int, list[str]] = {}
+        # Normalized key -> (entity id, confidence), or None for no match. Only
+        # valid until the index grows, so _register drops it when a key is added.
+        self._match_cache: dict[str, tuple[int, float] | None] = {}
         self._load()
 
     def _load(self) -> None:
-        entities = self._db.execute(select(Entity)).scalars().all()
-        for entity in entities:
-            self._register(entity)
+        rows = self._db.execute(select(Entity.id, Entity.canonical_name, Entity.aliases))
+        for entity_id, canonical_name, aliases in rows:
+            self._register(entity_id, canonical_name, aliases)
 
-    def _register(self, entity: Entity) -> None:
-        names = [entity.canonical_name] + list(entity.aliases or [])
+    def _register(self, entity_id: int, canonical_name: str, aliases: list[str] | None) -> None:
+        self._names_by_id[entity_id] = canonical_name
+        names = [canonical_name] + list(aliases or [])
         for name in names:
+            if name in self._registered:
+                continue
+            self._registered.add(name)
             key = _normalize_entity_name(name)
-            if not key:
+            if not key or key in self._index:
                 continue
-            self._index.setdefault(key, entity.id)
+            self._index[key] = entity_id
+            self._match_cache.clear()
+            if len(key) >= 3:
+                self._keys_by_len.setdefault(len(key), []).append(key)
 
-    def _find_match(self, name: str) -> tuple[Entity, float] | None:
+    def _find_match(self, name: str) -> tuple[str, float] | None:
+        """Canonical name of the best-matching registered entity and its confidence."""
         key = _normalize_entity_name(name)
         if not key:
             return None
+        if key in self._match_cache:
+            cached = self._match_cache[key]
+        else:
+            cached = self._match_key(key)
+            if len(self._match_cache) >= _MATCH_CACHE_SIZE:
+                # FIFO eviction: dicts iterate in insertion order.
+                del self._match_cache[next(iter(self._match_cache))]
+            self._match_cache[key] = cached
+        if cached is None:
+            return None
+        entity_id, confidence = cached
+        canonical_name = self._names_by_id.get(entity_id)
+        if canonical_name is None:
+            return None
+        return canonical_name, confidence
+
+    def _match_key(self, key: str) -> tuple[int, float] | None:
         entity_id = self._index.get(key)
         if entity_id is not None:
-            entity = self._db.get(Entity, entity_id)
-            if entity is not None:
-                return entity, 1.0
-
-        best_ratio = 0.0
-        best_id: int | None = None
-        for existing_key, existing_id in self._index.items():
-            if len(existing_key) < 3:
-                continue
-            ratio = SequenceMatcher(None, key, existing_key).ratio()
-            if ratio > best_ratio:
-                best_ratio = ratio
-                best_id = existing_id
-
-        confidence = _ratio_to_confidence(best_ratio)
-        if confidence is None or best_id is None:
+            return entity_id, 1.0
+        # fuzz.ratio is 2*matches/(len_a+len_b), so a length gap alone caps it;
+        # only lengths inside the band can reach the cutoff at all.
+        key_len = len(key)
+        min_len = math.ceil(key_len * _FUZZY_CUTOFF / (2 - _FUZZY_CUTOFF))
+        max_len = math.floor(key_len * (2 - _FUZZY_CUTOFF) / _FUZZY_CUTOFF)
+        candidates = [
+            candidate
+            for length in range(max(min_len, 3), max_len + 1)
+            for candidate in self._keys_by_len.get(length, ())
+        ]
+        if not candidates:
             return None
-        entity = self._db.get(Entity, best_id)
-        if entity is None:
+        match = process.extractOne(
+            key, candidates, scorer=fuzz.ratio, score_cutoff=_FUZZY_CUTOFF * 100
+        )
+        if match is None:
             return None
-        return entity, confidence
+        best_key, score, _ = match
+        confidence = _ratio_to_confidence(score / 100)
+        if confidence is None:
+            return None
+        return self._index[best_key], confidence
 
     def resolve(
         self,
@@ -149,35 +261,39 @@ class EntityResolver:
         *,
         entity_type: str | None = None,
         aliases: list[str] | None = None,
-    ) -> tuple[Entity, float]:
+    ) -> tuple[int, float]:
+        """Resolve a name to an entity id (creating it if needed) and a match confidence."""
         candidate_names = [name] + list(aliases or [])
-        best_entity: Entity | None = None
+        best_name: str | None = None
         best_confidence = 0.0
 
         for candidate in candidate_names:
             match = self._find_match(candidate)
             if match and match[1] > best_confidence:
-                best_entity, best_confidence = match
+                best_name, best_confidence = match
+
+        if best_name is not None:
+            canonical_name = best_name
+        else:
+            canonical_name = name
+            best_confidence = 1.0
 
         merged_aliases = _merge_aliases(name, aliases)
-        if best_entity is not None:
-            resolved = get_or_create_entity(
-                self._db,
-                canonical_name=best_entity.canonical_name,
-                entity_type=entity_type,
-                aliases=merged_aliases,
-            )
-            self._register(resolved)
-            return resolved, best_confidence
+        entity_id = self._cache.get(
+            canonical_name, entity_type=entity_type, aliases=merged_aliases
+        )
+        if entity_id is not None:
+            return entity_id, best_confidence
 
         resolved = get_or_create_entity(
             self._db,
-            canonical_name=name,
+            canonical_name=canonical_name,
             entity_type=entity_type,
             aliases=merged_aliases,
         )
-        self._register(resolved)
-        return resolved, 1.0
+        self._register(resolved.id, resolved.canonical_name, resolved.aliases)
+        self._cache.store(resolved)
+        return resolved.id, best_confidence
 
 
 @dataclass
@@ -186,6 +302,17 @@ class CompanyProfile:
     aliases: list[str]
 
 
+@lru_cache(maxsize=1)
+def _llm_response_cache() -> LLMResponseCache | None:
+    if settings.llm_cache_size <= 0 and not settings.llm_cache_path:
+        return None
+    return LLMResponseCache(
+        max_entries=settings.llm_cache_size,
+        path=settings.llm_cache_path,
+        ttl_s=settings.llm_cache_ttl_s,
+    )
+
+
 def run_analysis(
     db: Session,
     domain: str,
@@ -199,8 +326,18 @@ def run_analysis(
         progress_cb("resolving_company")
 
     base_name = _heuristic_company_name(domain)
-    llm = LLMClient(api_key=settings.openai_api_key or "", model=settings.openai_model)
-    company = llm.resolve_company(domain, base_name)
+    llm = LLMClient(
+        api_key=settings.openai_api_key or "",
+        model=settings.openai_model,
+        max_rpm=settings.llm_max_rpm,
+        response_cache=_llm_response_cache(),
+        max_tokens_per_batch=settings.llm_max_batch_tokens,
+    )
+    try:
+        company = llm.resolve_company(domain, base_name)
+    except Exception:
+        llm.close()
+        raise
     aliases = _unique_terms([company.name] + list(company.aliases))
     competitor_names = _normalize_competitors(competitors or [])
     set_analysis_context(
@@ -214,6 +351,7 @@ def run_analysis(
         progress_cb("discovering_subreddits")
 
     # Use hybrid client: browser-based scraping with httpx fallback
+    reddit_workers = max(1, settings.reddit_concurrency)
     reddit = HybridRedditClient(
         use_browser=settings.browser_enabled,
         headless=settings.browser_headless,
@@ -226,23 +364,46 @@ def run_analysis(
         password=settings.reddit_password,
         user_agent=settings.reddit_user_agent,
         proxy_manager=proxy_manager,
+        max_rpm=settings.reddit_max_rpm,
+        token_cache_path=settings.reddit_token_cache_path,
+        # The fan-out pool runs REDDIT_CONCURRENCY workers; AIMD decides how many
+        # of them may have a request in flight at any moment.
+        backpressure=Backpressure(
+            initial=min(4, reddit_workers), max_capacity=reddit_workers
+        ),
     )
-    resolver = EntityResolver(db)
+    entity_cache = EntityCache()
+    resolver = EntityResolver(db, cache=entity_cache)
 
     try:
         discovery_terms = _select_terms(aliases, max_terms=3)
         discovery = _discover_subreddits(
             reddit,
+            db,
             discovery_terms,
             aliases,
             max_pages=settings.max_discovery_pages,
         )
         scored = score_subreddits(discovery)
-        scored.sort(key=lambda item: item.get("score", 0.0), reverse=True)
+        scored.sort(key=lambda item: item.score, reverse=True)
 
         top20 = scored[:20]
-        for item in top20:
-            upsert_subreddit(db, item)
+        upsert_subreddits(
+            db,
+            [
+                SubredditPayload(
+                    name=item.name,
+                    score=item.score,
+                    mention_count=item.mention_count,
+                    avg_engagement=item.avg_engagement,
+                    subscribers=item.subscribers,
+                    active_user_count=item.active_user_count,
+                    topic_relevance=item.topic_relevance,
+                    public_description=item.public_description,
+                )
+                for item in top20
+            ],
+        )
 
         top5 = top20[:5]
         if progress_cb:
@@ -256,8 +417,7 @@ def run_analysis(
             max_comments=settings.max_comments_per_post,
         )
 
-        for source in sources:
-            add_source(db, source)
+        add_sources_bulk(db, sources)
 
         sources = [source for source in sources if source.get("text")]
         if settings.max_llm_sources > 0:
@@ -267,22 +427,26 @@ def run_analysis(
             progress_cb("llm_extraction")
 
         source_map = {source["id"]: source for source in sources}
-        for batch in _batch(sources, max(1, settings.llm_batch_size)):
-            trimmed = [
-                {
-                    "id": source["id"],
-                    "text": source["text"][: settings.max_source_chars],
-                }
-                for source in batch
-            ]
-            try:
-                extraction = llm.extract_entities_relationships_batch(
-                    sources=trimmed,
-                    company_name=company.name,
-                    aliases=aliases,
-                    relationship_types=ALLOWED_RELATIONSHIPS,
-                )
-            except Exception:
+        for source in sources:
+            # Lowered once here and shared by every matcher that scans this source.
+            source["_text_lower"] = source["text"].lower()
+        mention_rows: list[dict[str, Any]] = []
+        relationship_rows: list[dict[str, Any]] = []
+        trimmed = [
+            {"id": source["id"], "text": source["text"][: settings.max_source_chars]}
+            for source in sources
+        ]
+        sizer = _BatchSizer(settings.llm_batch_size, max_size=settings.llm_max_batch_size)
+        for extraction in _extract_batches(
+            llm,
+            trimmed,
+            sizer,
+            company_name=company.name,
+            aliases=aliases,
+            concurrency=settings.llm_concurrency,
+            max_inflight_tokens=settings.llm_max_inflight_tokens,
+        ):
+            if extraction is None:
                 continue
 
             for result in extraction.results:
@@ -290,28 +454,44 @@ def run_analysis(
                 if not source:
                     continue
 
-                for entity in result.entities:
-                    if entity.confidence < settings.confidence_threshold:
-                        continue
-                    resolved, resolution_confidence = resolver.resolve(
+                entities = [
+                    entity
+                    for entity in result.entities
+                    if entity.confidence >= settings.confidence_threshold
+                ]
+                # (candidate, lowered) pairs, lowered once and reused for the scan and lookup.
+                candidates_by_entity = [
+                    [
+                        (candidate, candidate.lower())
+                        for candidate in [entity.canonical_name, *entity.aliases]
+                        if candidate
+                    ]
+                    for entity in entities
+                ]
+                # One scan of the source text locates every candidate of every entity.
+                positions = _first_positions(
+                    source["_text_lower"],
+                    {lowered for candidates in candidates_by_entity for _, lowered in candidates},
+                )
+
+                for entity, candidates in zip(entities, candidates_by_entity):
+                    entity_id, resolution_confidence = resolver.resolve(
                         entity.canonical_name,
                         entity_type=entity.entity_type,
                         aliases=entity.aliases,
                     )
 
-                    surface_form = _find_surface_form(
-                        source["text"], [entity.canonical_name] + list(entity.aliases)
-                    )
-                    snippet = (
-                        _snippet_for(source["text"], surface_form) if surface_form else None
-                    )
-                    add_mention(
-                        db,
-                        entity_id=resolved.id,
-                        source_id=source["id"],
-                        surface_form=surface_form or entity.canonical_name,
-                        snippet=snippet,
-                        confidence=min(1.0, entity.confidence * resolution_confidence),
+                    found = _find_surface_form(candidates, positions)
+                    surface_form = found[0] if found else None
+                    snippet = _snippet_for(source["text"], *found) if found else None
+                    mention_rows.append(
+                        {
+                            "entity_id": entity_id,
+                            "source_id": source["id"],
+                            "surface_form": surface_form or entity.canonical_name,
+                            "snippet": snippet,
+                            "confidence": min(1.0, entity.confidence * resolution_confidence),
+                        }
                     )
 
                 for rel in result.relationships:
@@ -320,20 +500,31 @@ def run_analysis(
                     if rel.relationship not in ALLOWED_RELATIONSHIPS:
                         continue
 
-                    subject_entity, _ = resolver.resolve(rel.subject)
-                    object_entity, _ = resolver.resolve(rel.object)
-
-                    add_relationship(
-                        db,
-                        subject_entity_id=subject_entity.id,
-                        object_entity_id=object_entity.id,
-                        relationship_type=rel.relationship,
-                        source_id=source["id"],
-                        evidence=rel.evidence,
-                        confidence=rel.confidence,
+                    subject_id, _ = resolver.resolve(rel.subject)
+                    object_id, _ = resolver.resolve(rel.object)
+
+                    relationship_rows.append(
+                        {
+                            "subject_entity_id": subject_id,
+                            "object_entity_id": object_id,
+                            "relationship_type": rel.relationship,
+                            "source_id": source["id"],
+                            "evidence": rel.evidence,
+                            "confidence": rel.confidence,
+                        }
                     )
+
+            if len(mention_rows) + len(relationship_rows) >= _WRITE_CHUNK_SIZE:
+                persist_extractions(db, mentions=mention_rows, relationships=relationship_rows)
+                mention_rows = []
+                relationship_rows = []
+
+        persist_extractions(db, mentions=mention_rows, relationships=relationship_rows)
+        db.commit()
     finally:
+        entity_cache.clear()
         reddit.close()
+        llm.close()
 
     if progress_cb:
         progress_cb("persisting")
@@ -350,6 +541,117 @@ def run_analysis(
     }
 
 
+class _BatchSizer:
+    """
+    Steers the LLM batch size toward the point where rows/second stops improving.
+
+    After ``window`` batches at the current size it probes double the size and
+    keeps it if per-request throughput improved by at least 10%; otherwise it
+    reverts and stops probing. A failed batch halves the size and also stops
+    probing, since oversized prompts are the usual cause.
+    """
+
+    def __init__(self, initial: int, *, max_size: int, window: int = 3) -> None:
+        self._max = max(1, max_size)
+        self.size = min(max(1, initial), self._max)
+        self._window = window
+        self._rates: list[float] = []
+        self._baseline: float | None = None
+        self._previous = self.size
+        self._settled = self.size >= self._max
+
+    def record(self, size: int, rows: int, elapsed: float) -> None:
+        # Batches submitted before the last size change don't describe this size.
+        if self._settled or size != self.size or elapsed <= 0:
+            return
+        self._rates.append(rows / elapsed)
+        if len(self._rates) < self._window:
+            return
+        rate = sum(self._rates) / len(self._rates)
+        self._rates.clear()
+
+        if self._baseline is not None and rate < self._baseline * 1.1:
+            self.size = self._previous
+            self._settled = True
+            return
+        self._baseline = rate
+        self._previous = self.size
+        self.size = min(self.size * 2, self._max)
+        self._settled = self.size == self._previous
+
+    def record_failure(self) -> None:
+        self.size = max(1, self.size // 2)
+        self._rates.clear()
+        self._settled = True
+
+
+def _extract_batches(
+    llm: LLMClient,
+    sources: list[dict[str, Any]],
+    sizer: _BatchSizer,
+    *,
+    company_name: str,
+    aliases: list[str],
+    concurrency: int,
+    max_inflight_tokens: int = 0,
+) -> Iterator[BatchExtractionResult | None]:
+    """
+    Keep up to ``concurrency`` extraction requests in flight and yield each batch's
+    result (None if it failed) in submission order.
+
+    Batches are cut from ``sources`` as workers free up, at whatever size ``sizer``
+    currently recommends. Results are consumed on the caller's thread, which owns
+    the Session, and in a fixed order so entity resolution matches a sequential run.
+    With ``max_inflight_tokens`` set, a batch is only submitted while the estimated
+    prompt tokens of all in-flight batches stay within it (one batch always may).
+    """
+
+    def timed_extract(batch: list[dict[str, Any]]) -> tuple[BatchExtractionResult, float]:
+        started = time.monotonic()
+        extraction = llm.extract_entities_relationships_batch(
+            sources=batch,
+            company_name=company_name,
+            aliases=aliases,
+            relationship_types=ALLOWED_RELATIONSHIPS,
+        )
+        return extraction, time.monotonic() - started
+
+    workers = max(1, concurrency)
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="llm")
+    pending: deque[tuple[Future, int, int, int]] = deque()
+    inflight_tokens = 0
+    offset = 0
+    try:
+        while offset < len(sources) or pending:
+            while offset < len(sources) and len(pending) < workers:
+                size = sizer.size
+                batch = sources[offset : offset + size]
+                tokens = sum(estimate_tokens(source["text"]) for source in batch)
+                if (
+                    max_inflight_tokens > 0
+                    and pending
+                    and inflight_tokens + tokens > max_inflight_tokens
+                ):
+                    break
+                offset += len(batch)
+                inflight_tokens += tokens
+                pending.append((executor.submit(timed_extract, batch), size, len(batch), tokens))
+
+            future, size, rows, tokens = pending.popleft()
+            try:
+                extraction, elapsed = future.result()
+            except Exception:
+                sizer.record_failure()
+                yield None
+                continue
+            finally:
+                inflight_tokens -= tokens
+            sizer.record(size, rows, elapsed)
+            yield extraction
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 def _heuristic_company_name(domain: str) -> str:
     domain = domain.strip()
     if "://" not in domain:
@@ -405,20 +707,96 @@ def _select_terms(aliases: list[str], max_terms: int) -> list[str]:
     return terms[:max_terms]
 
 
+def _reddit_pool() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(
+        max_workers=max(1, settings.reddit_concurrency), thread_name_prefix="reddit"
+    )
+
+
+def _about_fields(about: dict[str, Any]) -> dict[str, Any]:
+    data = about.get("data", {})
+    return {
+        "subscribers": data.get("subscribers", 0),
+        "active_user_count": data.get("active_user_count", 0),
+        "public_description": data.get("public_description") or "",
+    }
+
+
+# Process-wide front for the subreddit_about_cache table: name -> (fetched_at, fields).
+_about_memory: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+_about_memory_lock = threading.Lock()
+_ABOUT_MEMORY_SIZE = 1024
+
+
+def _subreddit_abouts(
+    client: RedditClient, db: Session, names: list[str]
+) -> dict[str, dict[str, Any]]:
+    """
+    /about fields for each name: from memory, then the SQLite cache, and only
+    then from Reddit. Entries older than SUBREDDIT_ABOUT_TTL_S are refetched.
+    """
+    ttl = settings.subreddit_about_ttl_s
+    now = time.time()
+    abouts: dict[str, dict[str, Any]] = {}
+    if ttl > 0:
+        with _about_memory_lock:
+            for name in names:
+                cached = _about_memory.get(name)
+                if cached is not None and cached[0] > now - ttl:
+                    _about_memory.move_to_end(name)
+                    abouts[name] = cached[1]
+        missing = [name for name in names if name not in abouts]
+        abouts.update(get_subreddit_abouts(db, missing, fetched_after=now - ttl))
+
+    missing = [name for name in names if name not in abouts]
+    with _reddit_pool() as pool:
+        fetched = {
+            name: _about_fields(about)
+            for name, about in zip(missing, pool.map(client.subreddit_about, missing))
+        }
+    abouts.update(fetched)
+    if ttl <= 0:
+        return abouts
+
+    store_subreddit_abouts(db, fetched, fetched_at=now)
+    with _about_memory_lock:
+        for name, fields in fetched.items():
+            _about_memory[name] = (now, fields)
+            _about_memory.move_to_end(name)
+        while len(_about_memory) > _ABOUT_MEMORY_SIZE:
+            _about_memory.popitem(last=False)
+    return abouts
+
+
 def _discover_subreddits(
-    client: RedditClient, terms: list[str], alias_terms: list[str], max_pages: int
-) -> list[dict[str, Any]]:
-    subreddit_map: dict[str, dict[str, Any]] = {}
+    client: RedditClient,
+    db: Session,
+    terms: list[str],
+    alias_terms: list[str],
+    max_pages: int,
+) -> list[SubredditMetrics]:
+    subreddit_map: dict[str, SubredditMetrics] = {}
     seen_posts: set[str] = set()
 
-    for term in terms:
+    def search_term(term: str) -> list[list[dict[str, Any]]]:
+        pages = []
         after: str | None = None
         for _ in range(max_pages):
             data = client.search_posts(query=term, limit=100, time_filter="month", after=after)
             listing = data.get("data", {})
-            children = listing.get("children", [])
+            pages.append(listing.get("children", []))
             after = listing.get("after")
+            if not after:
+                break
+        return pages
 
+    # Terms are searched concurrently (each term's page cursor stays sequential) and
+    # merged in term order, so dedupe and counts match a sequential walk.
+    with _reddit_pool() as pool:
+        term_pages = list(pool.map(search_term, terms))
+
+    for pages in term_pages:
+        for children in pages:
             for child in children:
                 post = child.get("data", {})
                 post_id = post.get("name") or post.get("id")
@@ -430,43 +808,32 @@ def _discover_subreddits(
                 if not subreddit:
                     continue
 
-                entry = subreddit_map.setdefault(
-                    subreddit,
-                    {
-                        "name": subreddit,
-                        "mention_count": 0,
-                        "engagement_sum": 0.0,
-                        "engagement_count": 0,
-                    },
-                )
-                entry["mention_count"] += 1
+                entry = subreddit_map.get(subreddit)
+                if entry is None:
+                    entry = subreddit_map[subreddit] = SubredditMetrics(name=subreddit)
+                entry.mention_count += 1
                 score = post.get("score") or 0
                 comments = post.get("num_comments") or 0
-                entry["engagement_sum"] += float(score + comments)
-                entry["engagement_count"] += 1
-
-            if not after:
-                break
+                entry.engagement_sum += float(score + comments)
+                entry.engagement_count += 1
 
     subreddit_items = list(subreddit_map.items())
     subreddit_items.sort(
-        key=lambda item: (
-            item[1].get("mention_count", 0),
-            item[1].get("engagement_sum", 0.0),
-        ),
+        key=lambda item: (item[1].mention_count, item[1].engagement_sum),
         reverse=True,
     )
     if settings.max_discovered_subreddits > 0:
         subreddit_items = subreddit_items[: settings.max_discovered_subreddits]
 
     # Fetch metadata for discovered subreddits.
+    topic_matcher = _TopicMatcher(alias_terms)
+    abouts = _subreddit_abouts(client, db, [name for name, _ in subreddit_items])
     for name, entry in subreddit_items:
-        about = client.subreddit_about(name)
-        data = about.get("data", {})
-        entry["subscribers"] = data.get("subscribers", 0)
-        entry["active_user_count"] = data.get("active_user_count", 0)
-        entry["public_description"] = data.get("public_description") or ""
-        entry["topic_relevance"] = 1 if _matches_topic(entry["public_description"], alias_terms) else 0
+        about = abouts[name]
+        entry.subscribers = about["subscribers"]
+        entry.active_user_count = about["active_user_count"]
+        entry.public_description = about["public_description"]
+        entry.topic_relevance = 1 if topic_matcher.matches(entry.public_description) else 0
 
     return [entry for _, entry in subreddit_items]
 
@@ -475,7 +842,7 @@ def _fetch_sources(
     client: RedditClient,
     company_name: str,
     aliases: list[str],
-    subreddits: list[dict[str, Any]],
+    subreddits: list[SubredditMetrics],
     *,
     max_posts: int,
     max_comments: int,
@@ -483,20 +850,47 @@ def _fetch_sources(
     sources: list[dict[str, Any]] = []
     query = _build_query([company_name] + aliases[:4])
 
-    for item in subreddits:
-        subreddit = item["name"]
-        data = client.subreddit_search_posts(
-            subreddit=subreddit,
-            query=query,
-            limit=max_posts,
-            time_filter="month",
-            sort="top",
+    with _reddit_pool() as pool:
+        listings = list(
+            pool.map(
+                lambda item: client.subreddit_search_posts(
+                    subreddit=item.name,
+                    query=query,
+                    limit=max_posts,
+                    time_filter="month",
+                    sort="top",
+                ),
+                subreddits,
+            )
         )
-        listing = data.get("data", {})
-        children = listing.get("children", [])
+        # Comment threads for every post are fetched concurrently up front; sources
+        # are then assembled in the same order as a sequential walk.
+        posts_by_subreddit = [
+            [
+                child.get("data", {})
+                for child in data.get("data", {}).get("children", [])[:max_posts]
+            ]
+            for data in listings
+        ]
+        comment_futures = [
+            [
+                pool.submit(
+                    client.comments,
+                    post_id=post["id"],
+                    limit=max_comments,
+                    depth=2,
+                    sort="top",
+                )
+                if post.get("id")
+                else None
+                for post in posts
+            ]
+            for posts in posts_by_subreddit
+        ]
 
-        for child in children[:max_posts]:
-            post = child.get("data", {})
+    for item, posts, futures in zip(subreddits, posts_by_subreddit, comment_futures):
+        subreddit = item.name
+        for post, comments_future in zip(posts, futures):
             post_id = post.get("name") or f"t3_{post.get('id')}"
             text = _post_text(post)
             permalink = post.get("permalink")
@@ -520,15 +914,9 @@ def _fetch_sources(
                 }
             )
 
-            post_short_id = post.get("id")
-            if not post_short_id:
+            if comments_future is None:
                 continue
-            comments_payload = client.comments(
-                post_id=post_short_id,
-                limit=max_comments,
-                depth=2,
-                sort="top",
-            )
+            comments_payload = comments_future.result()
             if not isinstance(comments_payload, list) or len(comments_payload) < 2:
                 continue
             comment_listing = comments_payload[1].get("data", {})
@@ -588,47 +976,77 @@ def _build_query(terms: list[str]) -> str:
     return " OR ".join(cleaned)
 
 
-def _matches_topic(description: str, terms: list[str]) -> bool:
-    if not description:
-        return False
-    lowered = description.lower()
-    for term in terms:
-        cleaned = term.strip().lower()
-        if len(cleaned) < 3:
-            continue
-        if cleaned in lowered:
-            return True
-    return False
+class _TopicMatcher:
+    """
+    Case-insensitive "does the text contain any of these terms" check. Terms
+    shorter than 3 characters are ignored. With pyahocorasick installed all
+    terms are matched in a single pass over the text.
+    """
 
+    def __init__(self, terms: list[str]) -> None:
+        self._terms = _unique_terms(
+            [cleaned for cleaned in (term.strip().lower() for term in terms) if len(cleaned) >= 3]
+        )
+        self._automaton = _build_automaton(self._terms)
 
-def _find_surface_form(text: str, candidates: list[str]) -> str | None:
-    lowered = text.lower()
-    for candidate in candidates:
-        if not candidate:
-            continue
-        if candidate.lower() in lowered:
-            return candidate
-    return None
+    def matches(self, description: str) -> bool:
+        if not description or not self._terms:
+            return False
+        lowered = description.lower()
+        if self._automaton is not None:
+            return next(self._automaton.iter(lowered), None) is not None
+        return any(term in lowered for term in self._terms)
 
 
-def _snippet_for(text: str, surface_form: str, window: int = 60) -> str | None:
-    if not surface_form:
+def _build_automaton(terms: Iterable[str]):
+    if ahocorasick is None:
         return None
-    lowered = text.lower()
-    idx = lowered.find(surface_form.lower())
-    if idx == -1:
+    automaton = ahocorasick.Automaton()
+    for term in terms:
+        automaton.add_word(term, term)
+    if len(automaton) == 0:
         return None
+    automaton.make_automaton()
+    return automaton
+
+
+def _first_positions(lowered: str, terms: set[str]) -> dict[str, int]:
+    """Start index of the first occurrence in ``lowered`` of each (lowercase) term found."""
+    if not terms:
+        return {}
+    automaton = _build_automaton(terms) if len(terms) > 1 else None
+    if automaton is None:
+        positions = {}
+        for term in terms:
+            idx = lowered.find(term)
+            if idx != -1:
+                positions[term] = idx
+        return positions
+
+    positions = {}
+    for end, term in automaton.iter(lowered):
+        if term not in positions:
+            positions[term] = end - len(term) + 1
+    return positions
+
+
+def _find_surface_form(
+    candidates: list[tuple[str, str]], positions: dict[str, int]
+) -> tuple[str, int] | None:
+    # Candidates are (original, lowered) pairs; order decides, not position in the text.
+    for candidate, lowered in candidates:
+        idx = positions.get(lowered)
+        if idx is not None:
+            return candidate, idx
+    return None
+
+
+def _snippet_for(text: str, surface_form: str, idx: int, window: int = 60) -> str:
     start = max(0, idx - window)
     end = min(len(text), idx + len(surface_form) + window)
     return text[start:end].strip()
 
 
-def _batch(values: list[dict[str, Any]], size: int) -> list[list[dict[str, Any]]]:
-    if size <= 0:
-        return [values]
-    return [values[i : i + size] for i in range(0, len(values), size)]
-
-
 def _count_entities(db: Session) -> int:
     from sqlalchemy import select, func
     from ..models import Entity
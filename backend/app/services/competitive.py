@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import Counter, defaultdict
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from itertools import combinations
+from functools import lru_cache
 import re
-from typing import Any
+from typing import Any, Collection
 
+import numpy as np
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
@@ -91,17 +93,31 @@ def _normalize_entity_name(value: str) -> str:
     return "".join(tokens)
 
 
-def _tokenize(text: str) -> list[str]:
-    cleaned = re.sub(r"[^a-z0-9\s]", " ", text.lower())
+# Same mapping as the regex in _tokenize for ASCII text, applied in one C-level pass.
+_TOKEN_TABLE = str.maketrans(
+    {
+        char: " "
+        for char in map(chr, range(128))
+        if not (char.isspace() or "a" <= char <= "z" or "0" <= char <= "9")
+    }
+)
+
+
+def _tokenize(lowered: str) -> list[str]:
+    if lowered.isascii():
+        return lowered.translate(_TOKEN_TABLE).split()
+    cleaned = re.sub(r"[^a-z0-9\s]", " ", lowered)
     return [token for token in cleaned.split() if token]
 
 
-def _sentiment_score(text: str) -> float:
-    tokens = _tokenize(text)
+def _sentiment_score(lowered: str) -> float:
+    tokens = _tokenize(lowered)
     if not tokens:
         return 0.0
-    pos = sum(1 for token in tokens if token in _POSITIVE_WORDS)
-    neg = sum(1 for token in tokens if token in _NEGATIVE_WORDS)
+    # Key-view intersection runs in C; only lexicon words that occur are summed.
+    counts = Counter(tokens)
+    pos = sum(counts[word] for word in counts.keys() & _POSITIVE_WORDS)
+    neg = sum(counts[word] for word in counts.keys() & _NEGATIVE_WORDS)
     total = pos + neg
     if total == 0:
         return 0.0
@@ -127,30 +143,69 @@ def _compile_alias_pattern(value: str) -> re.Pattern | None:
     return re.compile(pattern, re.IGNORECASE)
 
 
-def _build_target_patterns(context: AnalysisContext, targets: list[str]) -> dict[str, list[re.Pattern]]:
+@dataclass(frozen=True)
+class _TargetPatterns:
+    by_target: dict[str, list[re.Pattern]]
+    # Zero-width alternation of every pattern: one scan yields each position
+    # where some alias starts, with the first matching alias in lastgroup.
+    combined: re.Pattern | None
+    group_targets: dict[str, str]
+
+
+def _build_target_patterns(context: AnalysisContext, targets: list[str]) -> _TargetPatterns:
+    return _compile_target_patterns(
+        context.company_name, tuple(context.company_aliases or ()), tuple(targets)
+    )
+
+
+# The context only changes when an analysis runs, so repeated overview requests
+# reuse the compiled patterns. Callers must treat the result as read-only.
+@lru_cache(maxsize=32)
+def _compile_target_patterns(
+    company_name: str, company_aliases: tuple[str, ...], targets: tuple[str, ...]
+) -> _TargetPatterns:
     patterns: dict[str, list[re.Pattern]] = defaultdict(list)
     for target in targets:
         compiled = _compile_alias_pattern(target)
         if compiled:
             patterns[target].append(compiled)
 
-    for alias in context.company_aliases or []:
+    for alias in company_aliases:
         compiled = _compile_alias_pattern(alias)
         if compiled:
-            patterns[context.company_name].append(compiled)
+            patterns[company_name].append(compiled)
 
-    return patterns
+    group_targets: dict[str, str] = {}
+    parts = []
+    for target, compiled_list in patterns.items():
+        for compiled in compiled_list:
+            name = f"t{len(parts)}"
+            group_targets[name] = target
+            parts.append(f"(?P<{name}>{compiled.pattern})")
+    combined = re.compile("(?=" + "|".join(parts) + ")", re.IGNORECASE) if parts else None
+    return _TargetPatterns(by_target=dict(patterns), combined=combined, group_targets=group_targets)
 
 
-def _match_targets_in_text(text: str, patterns: dict[str, list[re.Pattern]]) -> set[str]:
-    if not text:
+def _match_targets_in_text(text: str, patterns: _TargetPatterns) -> set[str]:
+    if not text or patterns.combined is None:
         return set()
     matches: set[str] = set()
-    for target, compiled_list in patterns.items():
-        for compiled in compiled_list:
-            if compiled.search(text):
-                matches.add(target)
-                break
+    remaining = len(patterns.by_target)
+    for found in patterns.combined.finditer(text):
+        target = patterns.group_targets[found.lastgroup]
+        if target not in matches:
+            matches.add(target)
+            remaining -= 1
+        # Other aliases may start at the same position; alternation only reports the first.
+        pos = found.start()
+        for other, compiled_list in patterns.by_target.items():
+            if other in matches:
+                continue
+            if any(compiled.match(text, pos) for compiled in compiled_list):
+                matches.add(other)
+                remaining -= 1
+        if remaining == 0:
+            break
     return matches
 
 
@@ -180,17 +235,54 @@ def _build_target_index(context: AnalysisContext) -> tuple[list[str], dict[str,
     return targets, alias_map
 
 
-def _match_target(entity: Entity, alias_map: dict[str, str]) -> str | None:
-    key = _normalize_entity_name(entity.canonical_name)
+def _match_target(
+    canonical_name: str, aliases: list[str] | None, alias_map: dict[str, str]
+) -> str | None:
+    key = _normalize_entity_name(canonical_name)
     if key in alias_map:
         return alias_map[key]
-    for alias in entity.aliases or []:
+    for alias in aliases or []:
         alias_key = _normalize_entity_name(alias)
         if alias_key in alias_map:
             return alias_map[alias_key]
     return None
 
 
+def _count_co_mentions(target_sets: Collection[set[str]]) -> list[dict[str, Any]]:
+    # Each source's targets become a bitmask over the sorted target names, so
+    # bit i < bit j is already the sorted pair order. Sources with the same
+    # combination share one mask and are expanded into pairs only once.
+    names = sorted({target for targets_set in target_sets for target in targets_set})
+    bit_for = {name: 1 << idx for idx, name in enumerate(names)}
+    masks: Counter[int] = Counter()
+    for targets_set in target_sets:
+        if len(targets_set) < 2:
+            continue
+        mask = 0
+        for target in targets_set:
+            mask |= bit_for[target]
+        masks[mask] += 1
+
+    size = len(names)
+    pair_counts = [0] * (size * size)
+    for mask, sources in masks.items():
+        while mask:
+            low = mask & -mask
+            mask ^= low
+            first = low.bit_length() - 1
+            rest = mask
+            while rest:
+                other = rest & -rest
+                rest ^= other
+                pair_counts[first * size + other.bit_length() - 1] += sources
+
+    return [
+        {"pair": [names[cell // size], names[cell % size]], "count": count}
+        for cell, count in enumerate(pair_counts)
+        if count
+    ]
+
+
 def build_competitive_overview(db: Session) -> dict[str, Any]:
     context = get_analysis_context(db)
     if context is None:
@@ -204,52 +296,63 @@ def build_competitive_overview(db: Session) -> dict[str, Any]:
 
     targets, alias_map = _build_target_index(context)
 
-    mention_stmt = (
-        select(Mention, Entity, Source)
-        .join(Entity, Entity.id == Mention.entity_id)
-        .join(Source, Source.id == Mention.source_id)
-    )
-    rows = db.execute(mention_stmt).all()
-    sources = db.execute(select(Source)).scalars().all()
+    # Targets are resolved once per entity; the database then only returns the
+    # distinct (source, entity) pairs for entities that map to a target, and
+    # sources come back as plain column tuples rather than ORM objects.
+    entity_targets: dict[int, str] = {}
+    for entity_id, canonical_name, aliases in db.execute(
+        select(Entity.id, Entity.canonical_name, Entity.aliases)
+    ):
+        target = _match_target(canonical_name, aliases, alias_map)
+        if target:
+            entity_targets[entity_id] = target
+
+    mention_targets: dict[str, set[str]] = defaultdict(set)
+    if entity_targets:
+        pairs = db.execute(
+            select(Mention.source_id, Mention.entity_id)
+            .join(Source, Source.id == Mention.source_id)
+            .where(Mention.entity_id.in_(entity_targets))
+            .distinct()
+        )
+        for source_id, entity_id in pairs:
+            mention_targets[source_id].add(entity_targets[entity_id])
+
+    sources = db.execute(
+        select(Source.id, Source.subreddit, Source.text, Source.created_utc)
+    ).all()
 
     share_counts: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
     sentiment_counts: dict[str, dict[str, int]] = defaultdict(
         lambda: {"positive": 0, "neutral": 0, "negative": 0}
     )
-    source_targets: dict[str, set[str]] = defaultdict(set)
-    source_sentiment: dict[str, str] = {}
+    source_targets: dict[str, set[str]] = {}
     daily_counts: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
 
-    for mention, entity, source in rows:
-        target = _match_target(entity, alias_map)
-        if not target:
-            continue
-        source_targets[source.id].add(target)
-
     patterns = _build_target_patterns(context, targets)
-    source_index = {source.id: source for source in sources}
 
-    for source_id, source in source_index.items():
-        detected = _match_targets_in_text(source.text or "", patterns)
-        if detected:
-            source_targets[source_id].update(detected)
-
-    for source_id, targets_set in source_targets.items():
-        source = source_index.get(source_id)
-        if not source:
+    # Single pass per source: targets, then sentiment/share/day bucket while the
+    # lowered text is at hand.
+    for source_id, subreddit, text, created_utc in sources:
+        lowered = (text or "").lower()
+        targets_set = mention_targets.get(source_id, set()) | _match_targets_in_text(
+            lowered, patterns
+        )
+        if not targets_set:
             continue
-        for target in targets_set:
-            share_counts[source.subreddit][target] += 1
+        source_targets[source_id] = targets_set
 
-            if source_id not in source_sentiment:
-                score = _sentiment_score(source.text or "")
-                source_sentiment[source_id] = _sentiment_label(score)
-            sentiment_counts[target][source_sentiment[source_id]] += 1
+        sentiment_label = _sentiment_label(_sentiment_score(lowered))
+        date_key = None
+        if created_utc:
+            date_key = datetime.fromtimestamp(
+                created_utc, tz=timezone.utc
+            ).date().isoformat()
 
-            if source.created_utc:
-                date_key = datetime.fromtimestamp(
-                    source.created_utc, tz=timezone.utc
-                ).date().isoformat()
+        for target in targets_set:
+            share_counts[subreddit][target] += 1
+            sentiment_counts[target][sentiment_label] += 1
+            if date_key is not None:
                 daily_counts[target][date_key] += 1
 
     subreddit_share = []
@@ -281,40 +384,28 @@ def build_competitive_overview(db: Session) -> dict[str, Any]:
             }
         )
 
-    co_mentions_map: dict[tuple[str, str], int] = defaultdict(int)
-    for targets_set in source_targets.values():
-        if len(targets_set) < 2:
-            continue
-        for pair in combinations(sorted(targets_set), 2):
-            co_mentions_map[pair] += 1
-
-    co_mentions = [
-        {"pair": [pair[0], pair[1]], "count": count}
-        for pair, count in co_mentions_map.items()
-    ]
+    co_mentions = _count_co_mentions(source_targets.values())
     co_mentions.sort(key=lambda item: item["count"], reverse=True)
 
     anomalies = []
     for target, counts_by_day in daily_counts.items():
-        values = list(counts_by_day.values())
-        if len(values) < 3:
+        if len(counts_by_day) < 3:
             continue
-        mean = sum(values) / len(values)
-        variance = sum((val - mean) ** 2 for val in values) / len(values)
-        stdev = variance ** 0.5
+        values = np.fromiter(counts_by_day.values(), dtype=np.int64, count=len(counts_by_day))
+        stdev = values.std()
         if stdev == 0:
             continue
-        for date_key, count in counts_by_day.items():
-            z_score = (count - mean) / stdev
-            if z_score >= 2.0 and count >= 3:
-                anomalies.append(
-                    {
-                        "target": target,
-                        "date": date_key,
-                        "count": count,
-                        "z_score": round(z_score, 2),
-                    }
-                )
+        z_scores = (values - values.mean()) / stdev
+        dates = list(counts_by_day)
+        for idx in np.flatnonzero((z_scores >= 2.0) & (values >= 3)):
+            anomalies.append(
+                {
+                    "target": target,
+                    "date": dates[idx],
+                    "count": int(values[idx]),
+                    "z_score": round(float(z_scores[idx]), 2),
+                }
+            )
 
     anomalies.sort(key=lambda item: item["z_score"], reverse=True)
 
@@ -1,16 +1,18 @@
 from __future__ import annotations
 
+import secrets
 import threading
 import time
-import uuid
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 
+from ..core.config import settings
 from ..utils.logging import get_logger
 
 logger = get_logger("sie.jobs")
 
 
-@dataclass
+@dataclass(frozen=True)
 class JobStatus:
     job_id: str
     status: str
@@ -25,23 +27,35 @@ class JobStatus:
 
 
 class JobManager:
-    def __init__(self) -> None:
+    """
+    Jobs are immutable snapshots; every change stores a new JobStatus under _lock.
+
+    Readers (status polling) skip the lock: a dict lookup or attribute read always
+    sees either the previous snapshot or the new one, never a half-updated job.
+    Finished jobs are dropped ``ttl_s`` seconds after they complete or fail.
+    """
+
+    def __init__(self, ttl_s: float = 3600.0) -> None:
         self._lock = threading.Lock()
         self._active_job_id: str | None = None
-        self._jobs: dict[str, JobStatus] = {}
+        # Creation order; with one job running at a time, the oldest finish first.
+        self._jobs: OrderedDict[str, JobStatus] = OrderedDict()
+        self._ttl_s = ttl_s
 
     def create_job(self, domain: str, competitors: list[str] | None = None) -> JobStatus:
+        # Built before taking the lock; only the busy check and insert need it.
+        job_id = secrets.token_hex(16)
+        job = JobStatus(
+            job_id=job_id,
+            status="queued",
+            domain=domain,
+            competitors=list(competitors or []),
+            created_at=time.time(),
+        )
         with self._lock:
             if self._active_job_id is not None:
                 raise RuntimeError("busy")
-            job_id = uuid.uuid4().hex
-            job = JobStatus(
-                job_id=job_id,
-                status="queued",
-                domain=domain,
-                competitors=list(competitors or []),
-                created_at=time.time(),
-            )
+            self._evict_expired(job.created_at)
             self._jobs[job_id] = job
             self._active_job_id = job_id
             logger.info("Job queued: %s domain=%s", job_id, domain)
@@ -49,46 +63,57 @@ class JobManager:
 
     def start_job(self, job_id: str) -> JobStatus:
         with self._lock:
-            job = self._jobs[job_id]
-            job.status = "running"
-            job.started_at = time.time()
-            job.progress = "starting"
+            job = replace(
+                self._jobs[job_id], status="running", started_at=time.time(), progress="starting"
+            )
+            self._jobs[job_id] = job
             logger.info("Job started: %s domain=%s", job_id, job.domain)
             return job
 
     def finish_job(self, job_id: str, result: dict | None = None) -> None:
         with self._lock:
-            job = self._jobs[job_id]
-            job.status = "complete"
-            job.finished_at = time.time()
-            job.progress = "complete"
-            job.result = result
+            self._jobs[job_id] = replace(
+                self._jobs[job_id],
+                status="complete",
+                finished_at=time.time(),
+                progress="complete",
+                result=result,
+            )
             self._active_job_id = None
             logger.info("Job complete: %s", job_id)
 
     def fail_job(self, job_id: str, error: str) -> None:
         with self._lock:
-            job = self._jobs[job_id]
-            job.status = "failed"
-            job.finished_at = time.time()
-            job.progress = "failed"
-            job.error = error
+            self._jobs[job_id] = replace(
+                self._jobs[job_id],
+                status="failed",
+                finished_at=time.time(),
+                progress="failed",
+                error=error,
+            )
             self._active_job_id = None
             logger.error("Job failed: %s error=%s", job_id, error)
 
     def update_progress(self, job_id: str, progress: str) -> None:
         with self._lock:
-            job = self._jobs[job_id]
-            job.progress = progress
+            self._jobs[job_id] = replace(self._jobs[job_id], progress=progress)
             logger.info("Job progress: %s %s", job_id, progress)
 
+    def _evict_expired(self, now: float) -> None:
+        # Caller holds _lock. Stops at the first job that is unfinished or still fresh.
+        if self._ttl_s <= 0:
+            return
+        while self._jobs:
+            job = next(iter(self._jobs.values()))
+            if job.finished_at is None or now - job.finished_at <= self._ttl_s:
+                break
+            self._jobs.popitem(last=False)
+
     def get_job(self, job_id: str) -> JobStatus | None:
-        with self._lock:
-            return self._jobs.get(job_id)
+        return self._jobs.get(job_id)
 
     def is_busy(self) -> bool:
-        with self._lock:
-            return self._active_job_id is not None
+        return self._active_job_id is not None
 
 
-job_manager = JobManager()
+job_manager = JobManager(ttl_s=settings.job_ttl_s)
@@ -1,10 +1,23 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import TypeVar
 
-from openai import OpenAI
-from pydantic import BaseModel, Field, ValidationError
+import httpx
+import orjson
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+
+from ..utils.logging import get_logger
+
+logger = get_logger("sie.llm")
 
 
 class LLMConfigError(RuntimeError):
@@ -46,15 +59,162 @@ class BatchExtractionResult(BaseModel):
     results: list[SourceExtraction] = Field(default_factory=list)
 
 
+class _RateLimiter:
+    """
+    Spaces requests at least 60/max_rpm seconds apart across threads.
+
+    Each caller reserves the next free slot under the lock and sleeps outside it,
+    so concurrent workers queue up instead of bursting past the provider's RPM.
+    """
+
+    def __init__(self, max_rpm: int) -> None:
+        self._interval = 60.0 / max_rpm
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class LLMResponseCache:
+    """
+    Exact-match cache of validated JSON responses, keyed by (model, system, user).
+
+    An in-memory LRU sits in front of an optional SQLite file, so a prompt that was
+    already answered is served locally within a process and across restarts.
+    Entries older than ``ttl_s`` (0 keeps them forever) are neither served nor kept
+    on disk. Returned dicts are shared between callers and must not be mutated.
+    """
+
+    def __init__(
+        self, max_entries: int = 1024, path: str | None = None, ttl_s: float = 0.0
+    ) -> None:
+        self._max_entries = max(0, max_entries)
+        self._ttl_s = max(0.0, ttl_s)
+        # key -> (stored_at epoch seconds, payload)
+        self._memory: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        if path:
+            try:
+                db_path = Path(path).expanduser()
+                db_path.parent.mkdir(parents=True, exist_ok=True)
+                self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS llm_cache "
+                    "(key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL)"
+                )
+                if self._ttl_s > 0:
+                    # Cached prompts carry scraped text; don't keep them past the TTL.
+                    self._conn.execute(
+                        "DELETE FROM llm_cache WHERE created_at <= ?", (self._cutoff(),)
+                    )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning("LLM response cache disabled on disk: %s", str(e))
+                self._conn = None
+
+    @staticmethod
+    def key(model: str, system_prompt: str, user_prompt: str) -> str:
+        raw = json.dumps([model, system_prompt, user_prompt], ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _cutoff(self) -> float:
+        # Entries stored at or before this time are expired; -inf without a TTL.
+        return time.time() - self._ttl_s if self._ttl_s > 0 else float("-inf")
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            cutoff = self._cutoff()
+            cached = self._memory.get(key)
+            if cached is not None:
+                if cached[0] > cutoff:
+                    self._memory.move_to_end(key)
+                    return cached[1]
+                del self._memory[key]
+            if self._conn is None:
+                return None
+            try:
+                row = self._conn.execute(
+                    "SELECT response, created_at FROM llm_cache WHERE key = ? AND created_at > ?",
+                    (key, cutoff),
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning("Failed to read LLM response cache: %s", str(e))
+                return None
+            if row is None:
+                return None
+            payload = orjson.loads(row[0])
+            self._remember(key, payload, row[1])
+            return payload
+
+    def put(self, key: str, payload: dict) -> None:
+        with self._lock:
+            now = time.time()
+            self._remember(key, payload, now)
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, response, created_at) VALUES (?, ?, ?)",
+                    (key, orjson.dumps(payload).decode(), now),
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning("Failed to write LLM response cache: %s", str(e))
+
+    def _remember(self, key: str, payload: dict, stored_at: float) -> None:
+        if self._max_entries == 0:
+            return
+        self._memory[key] = (stored_at, payload)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_entries:
+            self._memory.popitem(last=False)
+
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def _adapter(schema: type[_ModelT]) -> TypeAdapter[_ModelT]:
+    # Built once per response model and reused for every call.
+    return TypeAdapter(schema)
+
+
 @dataclass
 class LLMClient:
     api_key: str
     model: str
+    # Requests per minute across all threads using this client; 0 disables the cap.
+    max_rpm: int = 0
+    # Shared across clients so repeated prompts in later jobs skip the API.
+    response_cache: LLMResponseCache | None = None
+    # Estimated source tokens per extraction request; larger batches are split.
+    max_tokens_per_batch: int = 12000
 
     def __post_init__(self) -> None:
         if not self.api_key:
             raise LLMConfigError("OPENAI_API_KEY is required for LLM extraction")
-        self._client = OpenAI(api_key=self.api_key)
+        # Imported lazily: the SDK is heavy and only needed once a job actually runs.
+        from openai import DefaultHttpxClient, OpenAI
+
+        # One pooled HTTP/2 connection set for every call this client makes; the
+        # concurrent extraction workers multiplex over it instead of each holding
+        # its own TLS connection.
+        self._http = DefaultHttpxClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+        )
+        self._client = OpenAI(api_key=self.api_key, http_client=self._http)
+        self._limiter = _RateLimiter(self.max_rpm) if self.max_rpm > 0 else None
+
+    def close(self) -> None:
+        self._client.close()
 
     def resolve_company(self, domain: str, hint_name: str) -> CompanyResolution:
         system = (
@@ -68,8 +228,7 @@ class LLMClient:
             "Return JSON with keys: name (string), aliases (array of strings). "
             "Include the canonical name in aliases."
         )
-        payload = self._call_json(system, user)
-        return CompanyResolution.model_validate(payload)
+        return self._call_model(system, user, CompanyResolution)
 
     def extract_entities_relationships(
         self,
@@ -79,25 +238,19 @@ class LLMClient:
         aliases: list[str],
         relationship_types: list[str],
     ) -> ExtractionResult:
-        system = (
-            "Extract entities and relationships from text. "
-            "Use only the provided relationship types. "
-            "Return JSON only."
+        """Single-text convenience over the batch call, so both share one prompt and cache."""
+        batch = self.extract_entities_relationships_batch(
+            sources=[{"id": "text", "text": text}],
+            company_name=company_name,
+            aliases=aliases,
+            relationship_types=relationship_types,
         )
-        alias_str = ", ".join(aliases) if aliases else "none"
-        rel_str = ", ".join(relationship_types)
-        user = (
-            f"Company context: {company_name} (aliases: {alias_str})\n\n"
-            f"Text:\n{text}\n\n"
-            "Return JSON with keys: entities, relationships.\n"
-            "entities: array of {canonical_name, aliases, entity_type, confidence}.\n"
-            "relationships: array of {subject, relationship, object, confidence, evidence}.\n"
-            f"relationship must be one of: {rel_str}.\n"
-            "confidence is 0-1.\n"
-            "Return JSON only."
-        )
-        payload = self._call_json(system, user)
-        return ExtractionResult.model_validate(payload)
+        for result in batch.results:
+            if result.source_id == "text":
+                return ExtractionResult(
+                    entities=result.entities, relationships=result.relationships
+                )
+        return ExtractionResult()
 
     def extract_entities_relationships_batch(
         self,
@@ -107,35 +260,57 @@ class LLMClient:
         aliases: list[str],
         relationship_types: list[str],
     ) -> BatchExtractionResult:
-        system = (
-            "Extract entities and relationships from each source. "
-            "Use only the provided relationship types. "
-            "Return JSON only."
+        # Everything fixed for the job lives in the system message, so the provider
+        # can reuse its cached prefix; the user message carries only the sources.
+        system, cache_key = _extraction_preamble(
+            company_name, tuple(aliases), tuple(relationship_types)
         )
-        alias_str = ", ".join(aliases) if aliases else "none"
-        rel_str = ", ".join(relationship_types)
-        blocks = []
-        for source in sources:
-            source_id = source.get("id")
-            text = source.get("text", "")
-            blocks.append(f"Source {source_id}:\n{text}")
-        sources_blob = "\n\n".join(blocks)
+        results: list[SourceExtraction] = []
+        for chunk in _token_bins(sources, self.max_tokens_per_batch):
+            user = "\n\n".join(
+                f"Source {source.get('id')}:\n{source.get('text', '')}" for source in chunk
+            )
+            extraction = self._call_model(
+                system, user, BatchExtractionResult, prompt_cache_key=cache_key
+            )
+            if len(chunk) == len(sources):
+                return extraction
+            results.extend(extraction.results)
+        return BatchExtractionResult(results=results)
 
-        user = (
-            f"Company context: {company_name} (aliases: {alias_str})\n\n"
-            f"Sources:\n{sources_blob}\n\n"
-            "Return JSON with key: results.\n"
-            "results: array of {source_id, entities, relationships}.\n"
-            "entities: array of {canonical_name, aliases, entity_type, confidence}.\n"
-            "relationships: array of {subject, relationship, object, confidence, evidence}.\n"
-            f"relationship must be one of: {rel_str}.\n"
-            "confidence is 0-1.\n"
-            "Return JSON only."
-        )
-        payload = self._call_json(system, user)
-        return BatchExtractionResult.model_validate(payload)
+    def _call_model(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        schema: type[_ModelT],
+        *,
+        prompt_cache_key: str | None = None,
+    ) -> _ModelT:
+        adapter = _adapter(schema)
+        cache = self.response_cache
+        if cache is None:
+            return adapter.validate_python(
+                self._call_json(system_prompt, user_prompt, prompt_cache_key=prompt_cache_key)
+            )
+
+        key = cache.key(self.model, system_prompt, user_prompt)
+        payload = cache.get(key)
+        if payload is not None:
+            return adapter.validate_python(payload)
+        payload = self._call_json(system_prompt, user_prompt, prompt_cache_key=prompt_cache_key)
+        result = adapter.validate_python(payload)
+        # Only responses that passed validation are cached.
+        cache.put(key, payload)
+        return result
 
-    def _call_json(self, system_prompt: str, user_prompt: str) -> dict:
+    def _call_json(
+        self, system_prompt: str, user_prompt: str, *, prompt_cache_key: str | None = None
+    ) -> dict:
+        if self._limiter is not None:
+            self._limiter.acquire()
+        extra: dict = {}
+        if prompt_cache_key:
+            extra["prompt_cache_key"] = prompt_cache_key
         response = self._client.chat.completions.create(
             model=self.model,
             messages=[
@@ -143,17 +318,78 @@ class LLMClient:
                 {"role": "user", "content": user_prompt},
             ],
             response_format={"type": "json_object"},
+            **extra,
         )
         content = response.choices[0].message.content or ""
         return _parse_json(content)
 
 
+def estimate_tokens(text: str) -> int:
+    # ~4 characters per token for English text; only used for budgeting.
+    return len(text) // 4 + 1
+
+
+def _token_bins(sources: list[dict], max_tokens: int) -> list[list[dict]]:
+    """Greedily pack sources, in order, into bins of at most ``max_tokens`` (>= 1 source each)."""
+    if max_tokens <= 0:
+        return [sources]
+    bins: list[list[dict]] = []
+    current: list[dict] = []
+    used = 0
+    for source in sources:
+        tokens = estimate_tokens(source.get("text", ""))
+        if current and used + tokens > max_tokens:
+            bins.append(current)
+            current = []
+            used = 0
+        current.append(source)
+        used += tokens
+    if current or not bins:
+        bins.append(current)
+    return bins
+
+
+# Identical for every batch of a job, so it is built (and hashed) once per context.
+@lru_cache(maxsize=8)
+def _extraction_preamble(
+    company_name: str, aliases: tuple[str, ...], relationship_types: tuple[str, ...]
+) -> tuple[str, str]:
+    """System prompt for batch extraction and its stable ``prompt_cache_key``."""
+    alias_str = ", ".join(aliases) if aliases else "none"
+    rel_str = ", ".join(relationship_types)
+    system = (
+        "Extract entities and relationships from each source. "
+        "Use only the provided relationship types. "
+        "Return JSON only.\n\n"
+        f"Company context: {company_name} (aliases: {alias_str})\n\n"
+        "Each source in the user message starts with a line 'Source <id>:'.\n"
+        "Return JSON with key: results.\n"
+        "results: array of {source_id, entities, relationships}.\n"
+        "entities: array of {canonical_name, aliases, entity_type, confidence}.\n"
+        "relationships: array of {subject, relationship, object, confidence, evidence}.\n"
+        f"relationship must be one of: {rel_str}.\n"
+        "confidence is 0-1.\n"
+        "Return JSON only."
+    )
+    # Stable per preamble, so every batch of a job is routed to the same prefix cache.
+    cache_key = "sie-" + hashlib.sha256(system.encode("utf-8")).hexdigest()[:32]
+    return system, cache_key
+
+
 def _parse_json(content: str) -> dict:
+    # response_format=json_object means the body is normally the bare object.
+    try:
+        data = orjson.loads(content)
+    except orjson.JSONDecodeError:
+        data = None
+    if isinstance(data, dict):
+        return data
+    # Otherwise look for an object embedded in the text, e.g. inside an array.
     start = content.find("{")
     end = content.rfind("}")
     if start == -1 or end == -1 or end <= start:
         raise ValueError("LLM response did not contain JSON object")
-    data = json.loads(content[start : end + 1])
+    data = orjson.loads(content[start : end + 1])
     if not isinstance(data, dict):
         raise ValueError("LLM JSON response was not an object")
     return data
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import itertools
 import random
+from collections import deque
 import re
 import threading
 import time
@@ -9,6 +12,7 @@ from pathlib import Path
 from urllib.parse import unquote, urlparse
 
 import httpx
+from httpx_socks import AsyncProxyTransport
 
 from ..utils.logging import get_logger
 
@@ -43,6 +47,32 @@ USER_AGENTS = [
 ]
 
 
+_HOST_PORT_RE = re.compile(r"\b(?:\d{1,3}\.){3}\d{1,3}:\d{2,5}\b")
+
+
+# Proxies probed at once when validating a refreshed list.
+_VALIDATE_CONCURRENCY = 20
+
+# How many recently failed proxies are remembered and kept out of refreshes.
+_RECENT_FAILURES_SIZE = 512
+
+_URL_PREFIXES = ("socks5://", "socks4://", "http://", "https://")
+
+
+def _format_host_port(parts: list[str], scheme: str) -> str:
+    host, port = parts
+    return f"{scheme}://{host}:{port}"
+
+
+def _format_host_port_user_pass(parts: list[str], scheme: str) -> str:
+    host, port, user, password = parts
+    return f"{scheme}://{user}:{password}@{host}:{port}"
+
+
+# Proxy line formats by number of ':'-separated fields.
+_LINE_FORMATTERS = {2: _format_host_port, 4: _format_host_port_user_pass}
+
+
 def get_random_user_agent() -> str:
     """Return a random realistic user agent string."""
     return random.choice(USER_AGENTS)
@@ -79,6 +109,10 @@ class ProxyManager:
         proxifly_max_backoff_s: float = 30.0,
         proxifly_rate_limit_cooldown_s: float = 60.0,
         proxifly_max_wait_s: float = 5.0,
+        initial_fetch: bool = True,
+        validate_proxies: bool = False,
+        validate_url: str = "https://www.reddit.com/robots.txt",
+        validate_timeout_s: float = 3.0,
     ) -> None:
         self._proxy_url = proxy_url
         self._refresh_interval_s = refresh_interval_s
@@ -106,18 +140,36 @@ class ProxyManager:
         self._proxifly_max_wait_s = max(float(proxifly_max_wait_s or 0.0), 0.0)
         self._proxifly_next_allowed_epoch_s: float = 0.0
 
-        self._proxies: list[str] = []
-        self._index = 0
+        self._validate_proxies_enabled = bool(validate_proxies)
+        self._validate_url = validate_url
+        self._validate_timeout_s = max(float(validate_timeout_s or 0.0), 0.1)
+
+        # Immutable snapshot, replaced wholesale under _lock; readers never lock.
+        self._proxies: tuple[str, ...] = ()
+        self._counter = itertools.count()
         self._lock = threading.Lock()
+        # Most recently reported failures (set mirrors the deque for O(1) lookups);
+        # refreshes leave these out so a dead proxy isn't put straight back.
+        self._recent_failures: deque[str] = deque()
+        self._recent_failure_set: set[str] = set()
+
+        # One keep-alive client for Proxifly and list-URL fetches; built on first use
+        # and closed by stop().
+        self._http: httpx.Client | None = None
+        self._http_lock = threading.Lock()
 
         self._stop_event = threading.Event()
         self._refresh_thread: threading.Thread | None = None
+        # Set once the first fetch attempt has finished (successfully or not).
+        self._ready = threading.Event()
 
         # Load cache first (so we can still operate under provider rate limits).
         self._load_cache()
 
-        # Initial fetch
-        self._fetch_proxies()
+        # Initial fetch; when deferred, the refresh loop performs it on start.
+        if initial_fetch:
+            self._fetch_proxies()
+            self._ready.set()
 
     def _load_cache(self) -> None:
         if not self._cache_enabled or self._cache_path is None:
@@ -137,8 +189,7 @@ class ProxyManager:
             if not loaded:
                 return
             with self._lock:
-                self._proxies = loaded
-                self._index = 0
+                self._proxies = tuple(loaded)
             logger.info("Loaded %d proxies from cache", len(loaded))
         except Exception as e:
             logger.warning("Failed to load proxy cache: %s", str(e))
@@ -161,20 +212,19 @@ class ProxyManager:
 
     @property
     def proxy_count(self) -> int:
-        with self._lock:
-            return len(self._proxies)
+        return len(self._proxies)
 
     def get_next_proxy(self) -> str | None:
         """
         Returns the next proxy in round-robin order.
         Returns None if no proxies are available.
         """
-        with self._lock:
-            if not self._proxies:
-                return None
-            proxy = self._proxies[self._index % len(self._proxies)]
-            self._index += 1
-            return proxy
+        # Lock-free: the tuple is read once, and next() on itertools.count is atomic
+        # under the GIL, so concurrent callers still each get a distinct slot.
+        proxies = self._proxies
+        if not proxies:
+            return None
+        return proxies[next(self._counter) % len(proxies)]
 
     def report_failure(self, proxy_url: str) -> None:
         """
@@ -184,15 +234,24 @@ class ProxyManager:
         if not proxy_url:
             return
         with self._lock:
-            if not self._proxies:
-                return
-            try:
-                self._proxies.remove(proxy_url)
-                if self._index >= len(self._proxies):
-                    self._index = 0
-                logger.info("Removed failing proxy (remaining: %d)", len(self._proxies))
-            except ValueError:
+            if proxy_url not in self._recent_failure_set:
+                self._recent_failures.append(proxy_url)
+                self._recent_failure_set.add(proxy_url)
+                if len(self._recent_failures) > _RECENT_FAILURES_SIZE:
+                    self._recent_failure_set.discard(self._recent_failures.popleft())
+            if proxy_url not in self._proxies:
                 return
+            remaining = list(self._proxies)
+            remaining.remove(proxy_url)
+            self._proxies = tuple(remaining)
+        logger.info("Removed failing proxy (remaining: %d)", len(remaining))
+
+    def wait_ready(self, timeout: float | None = None) -> bool:
+        """
+        Block until the initial proxy fetch has completed.
+        Returns False if it is still pending after `timeout` seconds.
+        """
+        return self._ready.wait(timeout)
 
     def start_refresh_loop(self) -> None:
         """Start the background refresh thread."""
@@ -216,10 +275,23 @@ class ProxyManager:
         if self._refresh_thread is not None:
             self._refresh_thread.join(timeout=5.0)
             self._refresh_thread = None
+        with self._http_lock:
+            if self._http is not None:
+                self._http.close()
+                self._http = None
         logger.info("Proxy refresh loop stopped")
 
+    def _http_client(self) -> httpx.Client:
+        with self._http_lock:
+            if self._http is None:
+                self._http = httpx.Client(timeout=self._timeout_s)
+            return self._http
+
     def _refresh_loop(self) -> None:
         """Background loop that refreshes the proxy list periodically."""
+        if not self._ready.is_set():
+            self._fetch_proxies()
+            self._ready.set()
         while not self._stop_event.is_set():
             # Wait for the refresh interval (or until stop is signaled)
             if self._stop_event.wait(timeout=self._refresh_interval_s):
@@ -243,26 +315,13 @@ class ProxyManager:
             return None
 
         # Already in URL format
-        if line.startswith(("socks5://", "socks4://", "http://", "https://")):
+        if "://" in line and line.startswith(_URL_PREFIXES):
             return line
 
         parts = line.split(":")
-
-        if len(parts) == 2:
-            # host:port
-            host, port = parts
-            return f"{self._default_scheme}://{host}:{port}"
-
-        elif len(parts) == 4:
-            # host:port:user:pass
-            host, port, user, password = parts
-            return f"{self._default_scheme}://{user}:{password}@{host}:{port}"
-
-        elif len(parts) == 3:
-            # Could be host:port:user (incomplete) - skip
-            return None
-
-        return None
+        # host:port:user (incomplete) and anything else without a formatter is skipped.
+        formatter = _LINE_FORMATTERS.get(len(parts))
+        return formatter(parts, self._default_scheme) if formatter else None
 
     def _extract_host_ports(self, text: str) -> list[str]:
         """
@@ -270,7 +329,7 @@ class ProxyManager:
         This is a best-effort fallback when the source isn't a clean newline list.
         """
         # Keep it simple; validate later via _parse_proxy_line().
-        return re.findall(r"\b(?:\d{1,3}\.){3}\d{1,3}:\d{2,5}\b", text)
+        return _HOST_PORT_RE.findall(text)
 
     def _fetch_proxies_from_proxifly(self) -> list[str]:
         if not self._proxifly_api_key:
@@ -303,8 +362,7 @@ class ProxyManager:
         max_retries = max(0, int(self._proxifly_max_retries or 0))
 
         while True:
-            with httpx.Client(timeout=self._timeout_s) as client:
-                resp = client.post(url, json=payload)
+            resp = self._http_client().post(url, json=payload)
 
             # Rate limiting: set a cooldown and STOP spamming the API.
             if resp.status_code == 429:
@@ -427,9 +485,8 @@ class ProxyManager:
                     raw_text = Path(file_path).read_text(encoding="utf-8")
                     fetched_any = True
                 else:
-                    with httpx.Client(timeout=self._timeout_s) as client:
-                        resp = client.get(self._proxy_url)
-                        resp.raise_for_status()
+                    resp = self._http_client().get(self._proxy_url)
+                    resp.raise_for_status()
                     raw_text = resp.text or ""
                     fetched_any = True
 
@@ -442,14 +499,27 @@ class ProxyManager:
             if not fetched_any:
                 return
 
-            # Parse each line and convert to socks5:// format
-            valid_proxies = []
-            for line in lines:
-                parsed = self._parse_proxy_line(line)
-                if parsed:
-                    valid_proxies.append(parsed)
+            # Parse each line and convert to socks5:// format; dict.fromkeys drops
+            # duplicates while keeping the provider's order.
+            valid_proxies = list(
+                dict.fromkeys(filter(None, map(self._parse_proxy_line, lines)))
+            )
+
+            if self._validate_proxies_enabled and valid_proxies:
+                live = self._validate_proxies(valid_proxies)
+                if live:
+                    valid_proxies = live
+                else:
+                    logger.warning(
+                        "No proxy passed validation (%d candidates); using them unvalidated",
+                        len(valid_proxies),
+                    )
 
             with self._lock:
+                # Skip recently failed proxies, unless that would leave nothing.
+                healthy = [p for p in valid_proxies if p not in self._recent_failure_set]
+                if healthy:
+                    valid_proxies = healthy
                 old_count = len(self._proxies)
                 # If fetch succeeded but parsing produced nothing, keep the old pool.
                 if not valid_proxies and old_count > 0:
@@ -458,10 +528,7 @@ class ProxyManager:
                         old_count,
                     )
                     return
-                self._proxies = valid_proxies
-                # Reset index if list changed significantly
-                if self._index >= len(self._proxies):
-                    self._index = 0
+                self._proxies = tuple(valid_proxies)
 
             if valid_proxies:
                 self._write_cache(valid_proxies)
@@ -483,6 +550,59 @@ class ProxyManager:
         except Exception as e:
             logger.exception("Unexpected error fetching proxy list: %s", str(e))
 
+    def _validate_proxies(self, proxies: list[str]) -> list[str]:
+        """
+        Probe every candidate concurrently and keep the ones that answer.
+
+        Each proxy gets one GET to the validation URL with a hard deadline; only a
+        2xx/3xx response counts as alive, since a 403 or 429 means the exit IP is
+        already blocked. Order is preserved.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            # Called from inside an event loop; skip rather than block it.
+            return proxies
+
+        started = time.monotonic()
+        alive = asyncio.run(self._probe_all(proxies))
+        live = [proxy for proxy, ok in zip(proxies, alive) if ok]
+        logger.info(
+            "Validated proxies: %d/%d alive in %.1fs",
+            len(live),
+            len(proxies),
+            time.monotonic() - started,
+        )
+        return live
+
+    async def _probe_all(self, proxies: list[str]) -> list[bool]:
+        semaphore = asyncio.Semaphore(_VALIDATE_CONCURRENCY)
+
+        async def probe(proxy: str) -> bool:
+            async with semaphore:
+                try:
+                    return await asyncio.wait_for(
+                        self._probe(proxy), timeout=self._validate_timeout_s
+                    )
+                except Exception:
+                    return False
+
+        return await asyncio.gather(*(probe(proxy) for proxy in proxies))
+
+    async def _probe(self, proxy: str) -> bool:
+        headers = {"User-Agent": get_random_user_agent()}
+        if proxy.startswith(("socks4://", "socks5://")):
+            client = httpx.AsyncClient(
+                transport=AsyncProxyTransport.from_url(proxy), timeout=self._validate_timeout_s
+            )
+        else:
+            client = httpx.AsyncClient(proxy=proxy, timeout=self._validate_timeout_s)
+        async with client:
+            resp = await client.get(self._validate_url, headers=headers)
+        return 200 <= resp.status_code < 400
+
     def force_refresh(self) -> None:
         """Force an immediate refresh of the proxy list."""
         self._fetch_proxies()
@@ -1,17 +1,30 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import math
+import os
+import random
+import threading
 import time
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from collections import OrderedDict, deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
 import httpx
+import orjson
 from httpx_socks import SyncProxyTransport
 
+from ..utils.logging import get_logger
 from .proxy import get_random_user_agent
 
 if TYPE_CHECKING:
     from .proxy import ProxyManager
 
+logger = get_logger("sie.reddit")
+
 
 class RedditConfigError(RuntimeError):
     pass
@@ -36,6 +49,190 @@ class RedditToken:
         return time.time() >= (self.expires_at_epoch_s - 15)
 
 
+# Cached GET responses per client; /about pages rarely change, listings more often.
+_GET_CACHE_SIZE = 1024
+_ABOUT_TTL_S = 300.0
+_LISTING_TTL_S = 60.0
+
+
+# Responses worth another proxy: Reddit answers IP blocks with 403, and throttling
+# or gateway errors may clear on another route. Anything else (404, 400, 410, ...)
+# is returned as-is, since a fresh IP won't change it.
+_RETRYABLE_STATUSES = frozenset({403, 429, 502, 503, 504})
+# Proxies tried per request, split evenly across the base URLs, before going direct.
+_MAX_PROXY_ATTEMPTS = 5
+# Unauthenticated direct requests; shared and must not be mutated.
+_DIRECT_HEADERS = {"Accept": "application/json"}
+
+
+def _get_cache_ttl(path: str) -> float:
+    if path.endswith(("/about", "/about.json")):
+        return _ABOUT_TTL_S
+    return _LISTING_TTL_S
+
+
+# Statuses that retry_with_backoff re-sends to the same endpoint.
+_RETRY_ON_STATUSES = frozenset({429, 502, 503, 504})
+
+_R = TypeVar("_R")
+
+
+def backoff_delay(
+    attempt: int, retry_after: str | None = None, *, base: float = 0.5, cap: float = 60.0
+) -> float:
+    """Seconds to wait before retry ``attempt`` (0-based): Retry-After, else jittered 2^n."""
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), cap)
+        except ValueError:
+            pass
+    # Jitter keeps workers that were throttled together from retrying together.
+    return min(cap, base * 2**attempt) * (0.5 + random.random() * 0.5)
+
+
+def retry_with_backoff(
+    fn: Callable[[], _R],
+    *,
+    status: Callable[[_R], int] = attrgetter("status_code"),
+    max_tries: int = 4,
+    base: float = 0.5,
+    cap: float = 60.0,
+    retry_on: frozenset[int] = _RETRY_ON_STATUSES,
+    wait: Callable[[_R, float], None] | None = None,
+) -> _R:
+    """
+    Call ``fn`` until its response status is outside ``retry_on`` or the tries run out.
+
+    Between tries, waits ``backoff_delay`` seconds, honouring the response's
+    Retry-After. ``wait(resp, delay)`` replaces the plain sleep, e.g. to pause a
+    shared rate bucket or release the rejected response first. The last response
+    is returned whatever its status; exceptions from ``fn`` propagate.
+    """
+    attempt = 0
+    while True:
+        resp = fn()
+        attempt += 1
+        if status(resp) not in retry_on or attempt >= max_tries:
+            return resp
+        # Lower-case lookup works for both httpx (case-insensitive) and Playwright headers.
+        delay = backoff_delay(
+            attempt - 1, resp.headers.get("retry-after"), base=base, cap=cap  # type: ignore[attr-defined]
+        )
+        if wait is not None:
+            wait(resp, delay)
+        else:
+            time.sleep(delay)
+
+
+class Backpressure:
+    """
+    AIMD cap on concurrent Reddit requests, shared by every thread using a client.
+
+    Capacity floats between ``min_capacity`` and ``max_capacity``: it grows by
+    ``1/capacity`` per healthy response (status < 400 with mean latency of the last
+    ``window`` calls within ``target_latency_s``), i.e. by one per full round of
+    requests, and halves on 429/502/503 or a connection error.
+    """
+
+    _THROTTLE_STATUSES = frozenset({429, 502, 503})
+
+    def __init__(
+        self,
+        initial: int = 4,
+        *,
+        min_capacity: int = 1,
+        max_capacity: int = 32,
+        target_latency_s: float = 1.5,
+        window: int = 32,
+    ) -> None:
+        self._min = max(1, min_capacity)
+        self._max = max(self._min, max_capacity)
+        self._capacity = float(min(max(initial, self._min), self._max))
+        self._target_latency_s = target_latency_s
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._in_flight = 0
+        self._throttle_streak = 0
+        self._cond = threading.Condition()
+
+    @property
+    def capacity(self) -> int:
+        return int(self._capacity)
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self._in_flight >= int(self._capacity):
+                self._cond.wait()
+            self._in_flight += 1
+
+    def release(self, *, latency_s: float, status: int | None) -> None:
+        """Return a slot; ``status`` is None when the request raised."""
+        with self._cond:
+            self._in_flight -= 1
+            if status is None or status in self._THROTTLE_STATUSES:
+                self._capacity = max(float(self._min), self._capacity * 0.5)
+                self._throttle_streak += 1
+            else:
+                self._throttle_streak = 0
+                self._latencies.append(latency_s)
+                mean_latency = sum(self._latencies) / len(self._latencies)
+                if status < 400 and mean_latency <= self._target_latency_s:
+                    self._capacity = min(float(self._max), self._capacity + 1 / self._capacity)
+            self._cond.notify_all()
+
+    def throttle_delay(self, resp: httpx.Response) -> float:
+        """Seconds to back off after a throttled response: Retry-After, else jittered 2^n."""
+        return backoff_delay(
+            max(1, self._throttle_streak), resp.headers.get("retry-after"), base=1.0
+        )
+
+
+class RedditRateBucket:
+    """
+    Sliding-window request cap: at most ``capacity`` request starts per ``window_s``.
+
+    Blocks the caller before a request would go over, instead of reacting to 429s.
+    ``set_capacity`` lets the client tighten it from Reddit's rate-limit headers,
+    and ``pause`` holds every caller back for a Retry-After window.
+    """
+
+    def __init__(self, capacity: int = 60, window_s: float = 60.0) -> None:
+        self._default_capacity = max(1, capacity)
+        self._capacity = self._default_capacity
+        self._window_s = window_s
+        self._starts: deque[float] = deque()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def default_capacity(self) -> int:
+        return self._default_capacity
+
+    def set_capacity(self, capacity: int) -> None:
+        self._capacity = min(max(1, capacity), self._default_capacity)
+
+    def pause(self, delay_s: float) -> None:
+        """Allow no request starts for the next ``delay_s`` seconds."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + delay_s)
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    cutoff = now - self._window_s
+                    while self._starts and self._starts[0] <= cutoff:
+                        self._starts.popleft()
+                    if len(self._starts) < self._capacity:
+                        self._starts.append(now)
+                        return
+                    # Wait for the oldest start in the window to age out, then re-check.
+                    wait = self._starts[len(self._starts) - self._capacity] + self._window_s - now
+            time.sleep(max(wait, 0.01))
+
+
 class RedditClient:
     def __init__(
         self,
@@ -48,6 +245,9 @@ class RedditClient:
         timeout_s: float = 30.0,
         min_interval_s: float = 0.0,
         proxy_manager: ProxyManager | None = None,
+        backpressure: Backpressure | None = None,
+        max_rpm: int = 60,
+        token_cache_path: str | None = None,
     ) -> None:
         if not user_agent:
             raise RedditConfigError("Missing Reddit user agent")
@@ -60,7 +260,14 @@ class RedditClient:
         self._timeout_s = timeout_s
         self._min_interval_s = max(min_interval_s, 0.0)
         self._last_request_s = 0.0
+        # Callers may share one client across threads: pacing slots and token
+        # refreshes are taken under these locks.
+        self._rate_lock = threading.Lock()
+        self._token_lock = threading.Lock()
         self._proxy_manager = proxy_manager
+        self._backpressure = backpressure or Backpressure()
+        # Reddit allows ~60 requests/minute per OAuth client; 0 disables the bucket.
+        self._bucket = RedditRateBucket(max_rpm) if max_rpm > 0 else None
 
         self._use_oauth = all(
             [
@@ -71,42 +278,148 @@ class RedditClient:
             ]
         )
 
+        # GET responses by (path, params) -> (stored_at, payload); see get_json.
+        self._get_cache: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        self._get_cache_lock = threading.Lock()
+
         self._token: RedditToken | None = None
-        # Only create default client if no proxy manager (proxied requests use per-request clients)
-        self._http = httpx.Client(timeout=timeout_s) if not proxy_manager else None
+        # Direct-request headers for the current token, built once per token.
+        # The dict is shared by every request and must not be mutated.
+        self._cached_auth_headers: tuple[RedditToken, dict[str, str]] | None = None
+        # OAuth tokens outlive the process: a still-valid one is reused after a restart.
+        self._token_cache_path = Path(token_cache_path).expanduser() if token_cache_path else None
+        if self._use_oauth:
+            self._token = self._load_cached_token()
+        # Direct requests share one client; proxied ones get one pooled client per
+        # proxy URL, kept until the proxy fails or the RedditClient is closed.
+        # HTTP/2 multiplexes the fan-out workers over one TLS connection per host;
+        # the configured user agent rides on the client, not on every request.
+        self._http = httpx.Client(
+            timeout=timeout_s,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=50, max_keepalive_connections=20, keepalive_expiry=60.0
+            ),
+            headers={"User-Agent": user_agent},
+        )
+        self._proxy_clients: dict[str, httpx.Client] = {}
+        self._proxy_clients_lock = threading.Lock()
 
     def close(self) -> None:
-        if self._http is not None:
-            self._http.close()
+        self._http.close()
+        with self._proxy_clients_lock:
+            clients = list(self._proxy_clients.values())
+            self._proxy_clients.clear()
+        for client in clients:
+            client.close()
 
     def _get_http_client(self, proxy_url: str | None = None) -> httpx.Client:
         """Get an HTTP client, optionally configured with a SOCKS proxy."""
-        if proxy_url:
-            if proxy_url.startswith(("socks4://", "socks5://")):
-                transport = SyncProxyTransport.from_url(proxy_url)
-                return httpx.Client(transport=transport, timeout=self._timeout_s)
-            # httpx supports HTTP/HTTPS proxies directly.
-            return httpx.Client(proxy=proxy_url, timeout=self._timeout_s)
-        if self._http is not None:
+        if not proxy_url:
             return self._http
-        return httpx.Client(timeout=self._timeout_s)
+        client = self._proxy_clients.get(proxy_url)
+        if client is not None:
+            return client
+        with self._proxy_clients_lock:
+            client = self._proxy_clients.get(proxy_url)
+            if client is None:
+                limits = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+                if proxy_url.startswith(("socks4://", "socks5://")):
+                    transport = SyncProxyTransport.from_url(proxy_url, http2=True, limits=limits)
+                    client = httpx.Client(transport=transport, timeout=self._timeout_s)
+                else:
+                    # httpx supports HTTP/HTTPS proxies directly.
+                    client = httpx.Client(
+                        proxy=proxy_url, timeout=self._timeout_s, limits=limits, http2=True
+                    )
+                self._proxy_clients[proxy_url] = client
+            return client
+
+    def _report_proxy_failure(self, proxy_url: str) -> None:
+        # Drop the pooled client too, so a dead proxy doesn't keep sockets open.
+        if self._proxy_manager is not None:
+            self._proxy_manager.report_failure(proxy_url)
+        with self._proxy_clients_lock:
+            client = self._proxy_clients.pop(proxy_url, None)
+        if client is not None:
+            client.close()
+
+    def _token_cache_owner(self) -> str:
+        # Tokens are only reused for the same app and account.
+        raw = f"{self._client_id}:{self._username}".encode("utf-8")
+        return hashlib.sha256(raw).hexdigest()
+
+    def _load_cached_token(self) -> RedditToken | None:
+        if self._token_cache_path is None:
+            return None
+        try:
+            payload = json.loads(self._token_cache_path.read_text(encoding="utf-8"))
+            if payload.pop("owner", None) != self._token_cache_owner():
+                return None
+            token = RedditToken(**payload)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Ignoring unreadable Reddit token cache: %s", str(e))
+            return None
+        return None if token.is_expired() else token
+
+    def _store_token(self, token: RedditToken) -> None:
+        if self._token_cache_path is None:
+            return
+        try:
+            self._token_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._token_cache_path.with_suffix(self._token_cache_path.suffix + ".tmp")
+            # Owner-only: the file holds a live bearer token.
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump({"owner": self._token_cache_owner(), **asdict(token)}, fh)
+            tmp.replace(self._token_cache_path)
+        except OSError as e:
+            logger.warning("Failed to write Reddit token cache: %s", str(e))
+
+    def _forget_token(self) -> None:
+        self._token = None
+        self._cached_auth_headers = None
+        if self._token_cache_path is None:
+            return
+        try:
+            self._token_cache_path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning("Failed to remove Reddit token cache: %s", str(e))
 
     def _auth_headers(self, proxy_url: str | None = None) -> dict[str, str]:
-        # Use random user agent when going through proxy for better anonymity
-        user_agent = get_random_user_agent() if proxy_url else self._user_agent
-
+        # Direct requests get the configured user agent from self._http; proxied
+        # ones use a random user agent for better anonymity.
         if not self._use_oauth:
-            return {"User-Agent": user_agent, "Accept": "application/json"}
+            if proxy_url:
+                return {"User-Agent": get_random_user_agent(), "Accept": "application/json"}
+            return _DIRECT_HEADERS
         token = self._get_token(proxy_url)
-        return {"Authorization": f"Bearer {token.access_token}", "User-Agent": user_agent}
+        cached = self._cached_auth_headers
+        if cached is None or cached[0] is not token:
+            cached = (token, {"Authorization": f"Bearer {token.access_token}"})
+            self._cached_auth_headers = cached
+        if proxy_url:
+            # Fresh user agent per proxied call; the Authorization value is reused.
+            return {**cached[1], "User-Agent": get_random_user_agent()}
+        return cached[1]
 
     def _get_token(self, proxy_url: str | None = None) -> RedditToken:
         if not self._use_oauth:
             raise RedditConfigError("OAuth credentials not configured")
 
-        if self._token is not None and not self._token.is_expired():
-            return self._token
+        token = self._token
+        if token is not None and not token.is_expired():
+            return token
+
+        with self._token_lock:
+            # Another thread may have refreshed while this one waited.
+            if self._token is not None and not self._token.is_expired():
+                return self._token
+            return self._fetch_token(proxy_url)
 
+    def _fetch_token(self, proxy_url: str | None) -> RedditToken:
         url = "https://www.reddit.com/api/v1/access_token"
         # Use random user agent when going through proxy
         user_agent = get_random_user_agent() if proxy_url else self._user_agent
@@ -117,18 +430,12 @@ class RedditClient:
             "password": self._password,
         }
 
-        client = self._get_http_client(proxy_url)
-        try:
-            resp = client.post(
-                url,
-                auth=(self._client_id, self._client_secret),
-                headers=headers,
-                data=data,
-            )
-        finally:
-            # Close client if it was created for proxy
-            if proxy_url:
-                client.close()
+        resp = self._get_http_client(proxy_url).post(
+            url,
+            auth=(self._client_id, self._client_secret),
+            headers=headers,
+            data=data,
+        )
 
         if resp.status_code != 200:
             raise RedditAuthError(
@@ -148,8 +455,21 @@ class RedditClient:
             token_type=token_type,
             expires_at_epoch_s=time.time() + float(expires_in),
         )
+        self._cached_auth_headers = None
+        self._store_token(self._token)
         return self._token
 
+    def _wait_for_slot(self) -> None:
+        # Reserve the next start slot under the lock and sleep outside it, so
+        # concurrent callers are spaced min_interval_s apart rather than all
+        # waking together.
+        with self._rate_lock:
+            now = time.time()
+            slot = max(now, self._last_request_s + self._min_interval_s)
+            self._last_request_s = slot
+        if slot > now:
+            time.sleep(slot - now)
+
     def _maybe_sleep_for_rate_limit(self, resp: httpx.Response) -> None:
         remaining = resp.headers.get("X-Ratelimit-Remaining")
         reset_s = resp.headers.get("X-Ratelimit-Reset")
@@ -162,10 +482,32 @@ class RedditClient:
         except ValueError:
             return
 
+        if self._bucket is not None:
+            used = resp.headers.get("X-Ratelimit-Used")
+            try:
+                quota = remaining_val + float(used) if used is not None else None
+            except ValueError:
+                quota = None
+            # Under 10% of the quota left: only allow what remains until the reset.
+            if quota and remaining_val < 0.1 * quota:
+                self._bucket.set_capacity(int(remaining_val))
+            else:
+                self._bucket.set_capacity(self._bucket.default_capacity)
+
         # Simple approach: if close to limit, wait until reset.
         if remaining_val < 5 and reset_val > 0:
             time.sleep(min(reset_val, 60.0))
 
+    def _back_off(self, resp: httpx.Response, delay: float, proxy_url: str | None) -> None:
+        if resp.status_code == 429 and self._bucket is not None and (
+            self._use_oauth or proxy_url is None
+        ):
+            # The quota is shared by every request from this client (or this IP),
+            # so hold them all back rather than only this thread.
+            self._bucket.pause(delay)
+        else:
+            time.sleep(delay)
+
     def request(
         self,
         method: str,
@@ -188,67 +530,69 @@ class RedditClient:
         def _do_request(proxy_url: str | None, url: str) -> httpx.Response:
             headers = self._auth_headers(proxy_url)
 
+            if self._bucket is not None:
+                self._bucket.acquire()
             if self._min_interval_s > 0:
-                elapsed = time.time() - self._last_request_s
-                sleep_for = self._min_interval_s - elapsed
-                if sleep_for > 0:
-                    time.sleep(sleep_for)
+                self._wait_for_slot()
 
             client = self._get_http_client(proxy_url)
+            backpressure = self._backpressure
+            backpressure.acquire()
+            started = time.monotonic()
             try:
                 resp = client.request(
                     method, url, headers=headers, params=request_params, data=data
                 )
-                self._last_request_s = time.time()
 
                 if resp.status_code == 401 and self._use_oauth:
-                    # Token expired/invalid; refresh once.
-                    self._token = None
+                    # Token expired/invalid; drop it (and the cached copy) and refresh once.
+                    self._forget_token()
                     headers = self._auth_headers(proxy_url)
                     resp = client.request(
                         method, url, headers=headers, params=request_params, data=data
                     )
+            except Exception:
+                backpressure.release(latency_s=time.monotonic() - started, status=None)
+                raise
+            backpressure.release(latency_s=time.monotonic() - started, status=resp.status_code)
+            logger.debug("%s %s -> %s (%s)", method, url, resp.status_code, resp.http_version)
 
-                if resp.status_code in (429, 503):
-                    time.sleep(2.0)
-
-                self._maybe_sleep_for_rate_limit(resp)
-                return resp
-            finally:
-                if proxy_url:
-                    client.close()
+            self._maybe_sleep_for_rate_limit(resp)
+            return resp
 
         # If proxies are flaky or blocked, rotate a few times then fall back to direct.
-        max_proxy_attempts = 5
         last_exc: Exception | None = None
         if self._proxy_manager:
+            per_base = math.ceil(_MAX_PROXY_ATTEMPTS / len(bases))
             for base in bases:
                 url = f"{base}{path}"
-                for _ in range(max_proxy_attempts):
+                for _ in range(per_base):
                     proxy_url = self._proxy_manager.get_next_proxy()
                     if not proxy_url:
                         break
                     try:
                         resp = _do_request(proxy_url, url)
-                        # Treat "blocked" responses as proxy failures and rotate.
-                        if resp.status_code == 403:
-                            self._proxy_manager.report_failure(proxy_url)
-                            continue
-                        # Rotate on transient overload as well.
-                        if resp.status_code in (429, 503):
-                            continue
-                        return resp
                     except Exception as exc:
                         last_exc = exc
                         # Remove this proxy from the current pool and try the next one.
-                        self._proxy_manager.report_failure(proxy_url)
+                        self._report_proxy_failure(proxy_url)
                         continue
+                    if resp.status_code not in _RETRYABLE_STATUSES:
+                        return resp
+                    # Treat "blocked" responses as proxy failures and rotate.
+                    if resp.status_code == 403:
+                        self._report_proxy_failure(proxy_url)
+                    elif resp.status_code in (429, 503):
+                        self._back_off(resp, self._backpressure.throttle_delay(resp), proxy_url)
 
         try:
             # Direct attempt (no proxy). Try both hosts when not using OAuth.
             for base in bases:
                 url = f"{base}{path}"
-                resp = _do_request(None, url)
+                resp = retry_with_backoff(
+                    lambda: _do_request(None, url),
+                    wait=lambda rejected, delay: self._back_off(rejected, delay, None),
+                )
                 if resp.status_code == 403 and not self._use_oauth:
                     continue
                 return resp
@@ -263,12 +607,38 @@ class RedditClient:
         *,
         params: dict[str, Any] | None = None,
     ) -> dict[str, Any] | list[Any]:
+        """
+        GET ``path`` and decode the JSON body.
+
+        First-page responses are cached briefly and the same object is handed to
+        every caller that hits the cache, so callers must not mutate the result.
+        """
+        # Cursor pages are fetched once per walk, so only first pages are cached.
+        ttl = 0.0 if params and params.get("after") else _get_cache_ttl(path)
+        key = (path, frozenset((params or {}).items()))
+        if ttl > 0:
+            now = time.monotonic()
+            with self._get_cache_lock:
+                cached = self._get_cache.get(key)
+                if cached is not None and now - cached[0] < ttl:
+                    self._get_cache.move_to_end(key)
+                    return cached[1]
+
         resp = self.request("GET", path, params=params)
         if resp.status_code != 200:
             raise RedditRequestError(
                 f"Reddit GET {path} failed: {resp.status_code} {resp.text}"
             )
-        return resp.json()
+        # Listings with comment trees run to megabytes; orjson parses the raw bytes
+        # without httpx's decode-to-str step.
+        payload = orjson.loads(resp.content)
+        if ttl > 0:
+            with self._get_cache_lock:
+                self._get_cache[key] = (time.monotonic(), payload)
+                self._get_cache.move_to_end(key)
+                while len(self._get_cache) > _GET_CACHE_SIZE:
+                    self._get_cache.popitem(last=False)
+        return payload
 
     def search_posts(
         self,
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-import json
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from typing import Any
+from urllib.parse import urlencode
 
-from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page
+import orjson
+from playwright.sync_api import sync_playwright, Browser, Page, Response
 try:
     from playwright_stealth import stealth_sync
 except Exception:  # pragma: no cover - optional stealth dependency
@@ -12,9 +16,17 @@ except Exception:  # pragma: no cover - optional stealth dependency
 
 from ..utils.logging import get_logger
 from .proxy import get_random_user_agent
+from .reddit import retry_with_backoff
 
 logger = get_logger("sie.reddit_browser")
 
+_BASE_URL = "https://old.reddit.com"
+
+
+def _build_url(path: str, params: dict[str, Any]) -> str:
+    # urlencode escapes the values, so queries containing '&', '#' or spaces survive.
+    return f"{_BASE_URL}{path}?{urlencode(params)}"
+
 
 class BrowserRedditClient:
     """
@@ -40,9 +52,26 @@ class BrowserRedditClient:
 
         self._playwright = None
         self._browser: Browser | None = None
-        self._context: BrowserContext | None = None
+        # Every call runs on one Playwright thread, so a single page serves them
+        # all; it is swapped for a fresh context (cookies, user agent) after a 403.
         self._page: Page | None = None
 
+    def _new_page(self) -> Page:
+        # Create context with realistic viewport and user agent
+        context = self._browser.new_context(
+            viewport={"width": 1920, "height": 1080},
+            user_agent=get_random_user_agent(),
+            locale="en-US",
+            timezone_id="America/New_York",
+        )
+        page = context.new_page()
+        page.set_default_timeout(self._timeout_ms)
+
+        # Apply stealth to avoid detection
+        if stealth_sync:
+            stealth_sync(page)
+        return page
+
     def _ensure_browser(self) -> Page:
         """Initialize browser if not already running."""
         if self._page is not None:
@@ -61,32 +90,29 @@ class BrowserRedditClient:
 
         self._browser = self._playwright.chromium.launch(**launch_options)
 
-        # Create context with realistic viewport and user agent
-        self._context = self._browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            user_agent=get_random_user_agent(),
-            locale="en-US",
-            timezone_id="America/New_York",
-        )
-
-        self._page = self._context.new_page()
-        self._page.set_default_timeout(self._timeout_ms)
-
-        # Apply stealth to avoid detection
-        if stealth_sync:
-            stealth_sync(self._page)
+        self._page = self._new_page()
 
         logger.info("Browser initialized (headless=%s, proxy=%s)", self._headless, bool(self._proxy))
         return self._page
 
+    def _rotate_page(self) -> None:
+        """Replace the current context with a fresh identity; keep the old one on failure."""
+        try:
+            page = self._new_page()
+        except Exception as e:
+            logger.warning("Failed to rotate browser context: %s", str(e))
+            return
+        old, self._page = self._page, page
+        try:
+            old.context.close()
+        except Exception as e:
+            logger.warning("Failed to close browser context: %s", str(e))
+
     def close(self) -> None:
         """Close browser and cleanup resources."""
         if self._page:
-            self._page.close()
+            self._page.context.close()
             self._page = None
-        if self._context:
-            self._context.close()
-            self._context = None
         if self._browser:
             self._browser.close()
             self._browser = None
@@ -106,40 +132,36 @@ class BrowserRedditClient:
     def _fetch_json(self, url: str) -> dict[str, Any] | list[Any]:
         """Fetch JSON from a URL using the browser."""
         page = self._ensure_browser()
-        self._rate_limit()
 
         logger.debug("Fetching: %s", url)
 
-        try:
-            response = page.goto(url, wait_until="networkidle")
+        def _get() -> Response:
+            self._rate_limit()
+            # Navigating keeps Chromium's own network stack and fingerprint; the body
+            # is read off the navigation response instead of scraped from the DOM,
+            # and there is no reason to wait for network idle on a JSON document.
+            response = page.goto(url, wait_until="domcontentloaded")
             self._last_request_s = time.time()
-
             if response is None:
                 raise RuntimeError(f"No response from {url}")
+            return response
+
+        try:
+            # Throttled and gateway errors back off the same way as the httpx client.
+            response = retry_with_backoff(_get, status=attrgetter("status"), max_tries=3)
 
             if response.status == 403:
+                # This identity is flagged; later requests get a fresh one.
+                self._rotate_page()
                 raise RuntimeError(f"Blocked (403) fetching {url}")
 
             if response.status != 200:
                 raise RuntimeError(f"HTTP {response.status} fetching {url}")
 
-            # Get the page content and parse as JSON
-            content = page.content()
-
-            # old.reddit.com returns JSON wrapped in HTML <pre> tags
-            # Extract JSON from the page
             try:
-                # Try to get raw text content from <pre> tag
-                pre_element = page.query_selector("pre")
-                if pre_element:
-                    json_text = pre_element.inner_text()
-                else:
-                    # Fallback: try body text
-                    json_text = page.inner_text("body")
-
-                return json.loads(json_text)
-            except json.JSONDecodeError:
-                # If JSON parsing fails, the page might have anti-bot content
+                return orjson.loads(response.body())
+            except ValueError:
+                # An HTML body here is usually an anti-bot interstitial
                 logger.warning("Failed to parse JSON from %s", url)
                 raise RuntimeError(f"Invalid JSON response from {url}")
 
@@ -157,16 +179,20 @@ class BrowserRedditClient:
         after: str | None = None,
     ) -> dict[str, Any]:
         """Search Reddit posts."""
-        params = f"q={query}&sort={sort}&t={time_filter}&limit={limit}&raw_json=1"
+        params: dict[str, Any] = {
+            "q": query,
+            "sort": sort,
+            "t": time_filter,
+            "limit": limit,
+            "raw_json": 1,
+        }
         if after:
-            params += f"&after={after}"
-        url = f"https://old.reddit.com/search.json?{params}"
-        return self._fetch_json(url)  # type: ignore[return-value]
+            params["after"] = after
+        return self._fetch_json(_build_url("/search.json", params))  # type: ignore[return-value]
 
     def subreddit_about(self, subreddit: str) -> dict[str, Any]:
         """Get subreddit metadata."""
-        url = f"https://old.reddit.com/r/{subreddit}/about.json?raw_json=1"
-        return self._fetch_json(url)  # type: ignore[return-value]
+        return self._fetch_json(_build_url(f"/r/{subreddit}/about.json", {"raw_json": 1}))  # type: ignore[return-value]
 
     def subreddit_search_posts(
         self,
@@ -179,11 +205,17 @@ class BrowserRedditClient:
         after: str | None = None,
     ) -> dict[str, Any]:
         """Search posts within a subreddit."""
-        params = f"q={query}&restrict_sr=true&sort={sort}&t={time_filter}&limit={limit}&raw_json=1"
+        params: dict[str, Any] = {
+            "q": query,
+            "restrict_sr": "true",
+            "sort": sort,
+            "t": time_filter,
+            "limit": limit,
+            "raw_json": 1,
+        }
         if after:
-            params += f"&after={after}"
-        url = f"https://old.reddit.com/r/{subreddit}/search.json?{params}"
-        return self._fetch_json(url)  # type: ignore[return-value]
+            params["after"] = after
+        return self._fetch_json(_build_url(f"/r/{subreddit}/search.json", params))  # type: ignore[return-value]
 
     def subreddit_posts(
         self,
@@ -195,13 +227,12 @@ class BrowserRedditClient:
         after: str | None = None,
     ) -> dict[str, Any]:
         """Get posts from a subreddit."""
-        params = f"limit={limit}&raw_json=1"
+        params: dict[str, Any] = {"limit": limit, "raw_json": 1}
         if sort == "top":
-            params += f"&t={time_filter}"
+            params["t"] = time_filter
         if after:
-            params += f"&after={after}"
-        url = f"https://old.reddit.com/r/{subreddit}/{sort}.json?{params}"
-        return self._fetch_json(url)  # type: ignore[return-value]
+            params["after"] = after
+        return self._fetch_json(_build_url(f"/r/{subreddit}/{sort}.json", params))  # type: ignore[return-value]
 
     def comments(
         self,
@@ -215,15 +246,18 @@ class BrowserRedditClient:
         # Remove t3_ prefix if present
         if post_id.startswith("t3_"):
             post_id = post_id[3:]
-        params = f"limit={limit}&depth={depth}&sort={sort}&raw_json=1"
-        url = f"https://old.reddit.com/comments/{post_id}.json?{params}"
-        return self._fetch_json(url)  # type: ignore[return-value]
+        params = {"limit": limit, "depth": depth, "sort": sort, "raw_json": 1}
+        return self._fetch_json(_build_url(f"/comments/{post_id}.json", params))  # type: ignore[return-value]
 
 
 class HybridRedditClient:
     """
     Hybrid client that tries browser-based scraping first,
     then falls back to httpx-based client if browser fails.
+
+    Safe to call from several threads. Playwright's sync API is bound to the
+    thread that started it, so every browser call runs on one dedicated worker
+    thread; httpx fallbacks run on the caller's thread.
     """
 
     def __init__(
@@ -243,6 +277,10 @@ class HybridRedditClient:
         password: str | None = None,
         user_agent: str = "SocialIntelEngine/0.1",
         proxy_manager: Any = None,
+        # Shared AIMD concurrency cap (reddit.Backpressure); one is created if omitted.
+        backpressure: Any = None,
+        max_rpm: int = 60,
+        token_cache_path: str | None = None,
     ) -> None:
         self._use_browser = use_browser
         self._browser_client: BrowserRedditClient | None = None
@@ -263,34 +301,47 @@ class HybridRedditClient:
             "user_agent": user_agent,
             "min_interval_s": min_interval_s,
             "proxy_manager": proxy_manager,
+            "backpressure": backpressure,
+            "max_rpm": max_rpm,
+            "token_cache_path": token_cache_path,
         }
 
         self._browser_failed = False
+        self._init_lock = threading.Lock()
+        self._browser_thread: ThreadPoolExecutor | None = None
 
     def _get_browser_client(self) -> BrowserRedditClient | None:
         """Lazily initialize browser client."""
         if not self._use_browser or self._browser_failed:
             return None
-        if self._browser_client is None:
-            try:
-                self._browser_client = BrowserRedditClient(**self._browser_config)
-            except Exception as e:
-                logger.warning("Failed to initialize browser: %s", str(e))
-                self._browser_failed = True
-                return None
+        with self._init_lock:
+            if self._browser_client is None:
+                try:
+                    self._browser_client = BrowserRedditClient(**self._browser_config)
+                except Exception as e:
+                    logger.warning("Failed to initialize browser: %s", str(e))
+                    self._browser_failed = True
+                    return None
+                self._browser_thread = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="playwright"
+                )
         return self._browser_client
 
     def _get_httpx_client(self):
         """Lazily initialize httpx client."""
-        if self._httpx_client is None:
-            from .reddit import RedditClient
-            self._httpx_client = RedditClient(**self._httpx_config)
+        with self._init_lock:
+            if self._httpx_client is None:
+                from .reddit import RedditClient
+                self._httpx_client = RedditClient(**self._httpx_config)
         return self._httpx_client
 
     def close(self) -> None:
         """Close all clients."""
         if self._browser_client:
-            self._browser_client.close()
+            # Playwright objects must be torn down on the thread that created them.
+            self._browser_thread.submit(self._browser_client.close).result()
+            self._browser_thread.shutdown()
+            self._browser_thread = None
             self._browser_client = None
         if self._httpx_client:
             self._httpx_client.close()
@@ -303,7 +354,7 @@ class HybridRedditClient:
         if browser and not self._browser_failed:
             try:
                 method = getattr(browser, method_name)
-                result = method(**kwargs)
+                result = self._browser_thread.submit(method, **kwargs).result()
                 logger.debug("Browser request succeeded: %s", method_name)
                 return result
             except Exception as e:
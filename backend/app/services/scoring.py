@@ -1,51 +1,122 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from math import log10
-from typing import Iterable
 
+import numpy as np
 
-def _min_max(value: float, min_val: float, max_val: float) -> float:
-    if max_val == min_val:
-        return 0.5
-    return (value - min_val) / (max_val - min_val)
 
+@dataclass(slots=True)
+class SubredditMetrics:
+    """Discovery counters and /about fields for one subreddit, plus its computed score."""
 
-def _safe_log_norm(value: int, max_value: int) -> float:
-    if value <= 0 or max_value <= 0:
-        return 0.0
-    return log10(value) / log10(max_value)
+    name: str
+    mention_count: int = 0
+    engagement_sum: float = 0.0
+    engagement_count: int = 0
+    subscribers: int = 0
+    active_user_count: int = 0
+    topic_relevance: int = 0
+    public_description: str | None = None
+    avg_engagement: float = 0.0
+    score: float = 0.0
 
 
-def score_subreddits(items: list[dict]) -> list[dict]:
+def _min_max_array(values: np.ndarray) -> np.ndarray:
+    low = values.min()
+    span = values.max() - low
+    if span == 0:
+        return np.full(values.shape, 0.5)
+    return (values - low) / span
+
+
+# Below this many items NumPy's per-call overhead outweighs the vectorized math.
+_VECTORIZE_MIN_ITEMS = 128
+
+
+def score_subreddits(items: list[SubredditMetrics]) -> list[SubredditMetrics]:
     if not items:
         return []
+    if len(items) < _VECTORIZE_MIN_ITEMS:
+        return _score_inline(items)
+    return _score_vectorized(items)
 
-    mention_counts = [item.get("mention_count", 0) for item in items]
-    avg_engagements = [
-        item.get("engagement_sum", 0.0) / max(1, item.get("engagement_count", 1))
-        for item in items
-    ]
-    max_subscribers = max(item.get("subscribers", 0) for item in items)
+
+def _score_inline(items: list[SubredditMetrics]) -> list[SubredditMetrics]:
+    # Min-max normalization for mentions and engagement, log10 scaling for
+    # subscribers; the log10 of the largest subscriber count is taken once.
+    mention_counts = []
+    avg_engagements = []
+    subscriber_counts = []
+    for item in items:
+        mention_counts.append(item.mention_count)
+        avg_engagements.append(item.engagement_sum / max(1, item.engagement_count))
+        subscriber_counts.append(item.subscribers)
 
     min_mentions = min(mention_counts)
-    max_mentions = max(mention_counts)
+    mention_span = max(mention_counts) - min_mentions
     min_engagement = min(avg_engagements)
-    max_engagement = max(avg_engagements)
+    engagement_span = max(avg_engagements) - min_engagement
+    max_subscribers = max(subscriber_counts)
+    log_max_subscribers = log10(max_subscribers) if max_subscribers > 0 else 0.0
 
-    for item, avg_engagement in zip(items, avg_engagements):
-        mention_norm = _min_max(item.get("mention_count", 0), min_mentions, max_mentions)
-        engagement_norm = _min_max(avg_engagement, min_engagement, max_engagement)
-        subscriber_norm = _safe_log_norm(item.get("subscribers", 0), max_subscribers)
-        topic_relevance = 1.0 if item.get("topic_relevance", 0) else 0.0
+    for item, mentions, avg_engagement, subscribers in zip(
+        items, mention_counts, avg_engagements, subscriber_counts
+    ):
+        mention_norm = (mentions - min_mentions) / mention_span if mention_span else 0.5
+        engagement_norm = (
+            (avg_engagement - min_engagement) / engagement_span if engagement_span else 0.5
+        )
+        subscriber_norm = (
+            log10(subscribers) / log_max_subscribers
+            if subscribers > 0 and log_max_subscribers > 0
+            else 0.0
+        )
+        topic_relevance = 1.0 if item.topic_relevance else 0.0
 
-        score = (
+        item.avg_engagement = avg_engagement
+        item.score = (
             mention_norm * 0.35
             + engagement_norm * 0.30
             + subscriber_norm * 0.20
             + topic_relevance * 0.15
         )
 
-        item["avg_engagement"] = avg_engagement
-        item["score"] = score
+    return items
+
+
+def _score_vectorized(items: list[SubredditMetrics]) -> list[SubredditMetrics]:
+    count = len(items)
+    mentions = np.fromiter((item.mention_count for item in items), dtype=np.float64, count=count)
+    engagement_sum = np.fromiter(
+        (item.engagement_sum for item in items), dtype=np.float64, count=count
+    )
+    engagement_count = np.fromiter(
+        (item.engagement_count for item in items), dtype=np.float64, count=count
+    )
+    subscribers = np.fromiter((item.subscribers for item in items), dtype=np.float64, count=count)
+    topic = np.fromiter(
+        (1.0 if item.topic_relevance else 0.0 for item in items), dtype=np.float64, count=count
+    )
+
+    avg_engagements = engagement_sum / np.maximum(engagement_count, 1.0)
+
+    # log10(subs) / log10(max subs), or 0 where subs <= 0 or the max carries no range.
+    log_max_subscribers = log10(subscribers.max()) if subscribers.max() > 0 else 0.0
+    subscriber_norm = np.zeros(count)
+    if log_max_subscribers > 0:
+        positive = subscribers > 0
+        subscriber_norm[positive] = np.log10(subscribers[positive]) / log_max_subscribers
+
+    scores = (
+        _min_max_array(mentions) * 0.35
+        + _min_max_array(avg_engagements) * 0.30
+        + subscriber_norm * 0.20
+        + topic * 0.15
+    )
+
+    for item, avg_engagement, score in zip(items, avg_engagements.tolist(), scores.tolist()):
+        item.avg_engagement = avg_engagement
+        item.score = score
 
     return items
@@ -2,15 +2,34 @@ from __future__ import annotations
 
 import logging
 
+import orjson
 
-def setup_logging(level: str = "INFO") -> None:
+_TEXT_FORMAT = "%(asctime)s %(levelname)s %(name)s - %(message)s"
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, so log shippers don't have to regex-parse messages."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(payload).decode()
+
+
+def setup_logging(level: str = "INFO", json_format: bool = False) -> None:
     root = logging.getLogger()
     if root.handlers:
         return
-    logging.basicConfig(
-        level=level.upper(),
-        format="%(asctime)s %(levelname)s %(name)s - %(message)s",
-    )
+    handler = logging.StreamHandler()
+    handler.setFormatter(JsonFormatter() if json_format else logging.Formatter(_TEXT_FORMAT))
+    root.addHandler(handler)
+    root.setLevel(level.upper())
 
 
 def get_logger(name: str) -> logging.Logger: